@@ -153,8 +153,7 @@ class Clickhouse(JDBCConnection):
         warnings.warn(msg, UserWarning, stacklevel=3)
         return "ru.yandex.clickhouse:clickhouse-jdbc:0.3.2"
 
-    @property
-    def jdbc_url(self) -> str:
+    def _build_jdbc_url(self) -> str:
         extra = self.extra.dict(by_alias=True)
         parameters = "&".join(f"{k}={v}" for k, v in sorted(extra.items()))
 
@@ -166,12 +165,15 @@ class Clickhouse(JDBCConnection):
     class Dialect(JDBCConnection.Dialect):
         @classmethod
         def _get_datetime_value_sql(cls, value: datetime) -> str:
-            result = value.strftime("%Y-%m-%d %H:%M:%S")
+            result = (
+                f"{value.year:04d}-{value.month:02d}-{value.day:02d} "
+                f"{value.hour:02d}:{value.minute:02d}:{value.second:02d}"
+            )
             return f"CAST('{result}' AS DateTime)"
 
         @classmethod
         def _get_date_value_sql(cls, value: date) -> str:
-            result = value.strftime("%Y-%m-%d")
+            result = value.isoformat()
             return f"CAST('{result}' AS Date)"
 
     class ReadOptions(JDBCConnection.ReadOptions):
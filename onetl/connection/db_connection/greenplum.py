@@ -576,8 +576,7 @@ class Greenplum(JDBCMixin, DBConnection):
     def instance_url(self) -> str:
         return f"{self.__class__.__name__.lower()}://{self.host}:{self.port}/{self.database}"
 
-    @property
-    def jdbc_url(self) -> str:
+    def _build_jdbc_url(self) -> str:
         extra = {
             key: value
             for key, value in self.extra.dict(by_alias=True).items()
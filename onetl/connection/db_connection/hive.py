@@ -774,7 +774,7 @@ class Hive(DBConnection):
         write_options = self.WriteOptions.parse(options)
 
         try:
-            self.get_df_schema(target)
+            table_columns = self.get_df_schema(target).names
             table_exists = True
 
             log.info("|%s| Table %r already exists", self.__class__.__name__, target)
@@ -785,7 +785,7 @@ class Hive(DBConnection):
         if table_exists and write_options.if_exists != HiveTableExistBehavior.REPLACE_ENTIRE_TABLE:
             # using saveAsTable on existing table does not handle
             # spark.sql.sources.partitionOverwriteMode=dynamic, so using insertInto instead.
-            self._insert_into(df, target, options)
+            self._insert_into(df, target, table_columns, options)
         else:
             # if someone needs to recreate the entire table using new set of options, like partitionBy or bucketBy,
             # if_exists="replace_entire_table" should be used
@@ -872,13 +872,11 @@ class Hive(DBConnection):
     def _execute_sql(self, query: str) -> DataFrame:
         return self.spark.sql(query)
 
-    def _sort_df_columns_like_table(self, table: str, df_columns: list[str]) -> list[str]:
+    def _sort_df_columns_like_table(self, table: str, table_columns: list[str], df_columns: list[str]) -> list[str]:
         # Hive is inserting columns by the order, not by their name
         # so if you're inserting dataframe with columns B, A, C to table with columns A, B, C, data will be damaged
         # so it is important to sort columns in dataframe to match columns in the table.
 
-        table_columns = self.spark.table(table).columns
-
         # But names could have different cases, this should not cause errors
         table_columns_normalized = [column.casefold() for column in table_columns]
         df_columns_normalized = [column.casefold() for column in df_columns]
@@ -922,6 +920,7 @@ class Hive(DBConnection):
         self,
         df: DataFrame,
         table: str,
+        table_columns: list[str],
         options: WriteOptions | dict | None = None,
     ) -> None:
         write_options = self.WriteOptions.parse(options)
@@ -939,7 +938,8 @@ class Hive(DBConnection):
         # Hive is inserting data to table by column position, not by name
         # So we should sort columns according their order in the existing table
         # instead of using order from the dataframe
-        columns = self._sort_df_columns_like_table(table, df.columns)
+        # Table columns are already fetched while checking table existence, no need to query metastore again
+        columns = self._sort_df_columns_like_table(table, table_columns, df.columns)
         writer = df.select(*columns).write
 
         # Writer option "partitionOverwriteMode" was added to Spark only in 2.4.0
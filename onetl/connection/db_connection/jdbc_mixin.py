@@ -36,6 +36,7 @@ if TYPE_CHECKING:
 log = logging.getLogger(__name__)
 
 T = TypeVar("T")
+JDBCMixinT = TypeVar("JDBCMixinT", bound="JDBCMixin")
 
 # options generated by JDBCMixin methods
 PROHIBITED_OPTIONS = frozenset(
@@ -105,10 +106,36 @@ class JDBCMixin(FrozenModel):
     # cached JDBC connection (Java object), plus corresponding GenericOptions (Python object)
     _last_connection_and_options: Optional[Tuple[Any, JDBCOptions]] = PrivateAttr(default=None)
 
+    # connection is immutable, so JDBC URL can be built only once
+    _jdbc_url: Optional[str] = PrivateAttr(default=None)
+
+    # Spark JDBC dialect (Java object) matching JDBC URL, resolved on first fetch/execute
+    _jdbc_dialect: Any = PrivateAttr(default=None)
+
     @property
-    @abstractmethod
     def jdbc_url(self) -> str:
         """JDBC Connection URL"""
+        if self._jdbc_url is None:
+            self._jdbc_url = self._build_jdbc_url()
+
+        return self._jdbc_url
+
+    def copy(self: JDBCMixinT, *, update: dict | None = None, **kwargs) -> JDBCMixinT:
+        result = super().copy(update=update, **kwargs)
+        if update:
+            # JDBC URL, dialect and connection depend on connection attributes, so they cannot be reused by the copy
+            result._jdbc_url = None
+            result._jdbc_dialect = None
+            result._last_connection_and_options = None
+        return result
+
+    @abstractmethod
+    def _build_jdbc_url(self) -> str:
+        """
+        Build JDBC Connection URL from connection attributes.
+
+        Called only once, result is cached by :obj:`~jdbc_url` property.
+        """
 
     @slot
     def close(self):
@@ -627,6 +654,19 @@ class JDBCMixin(FrozenModel):
 
         return self._resultset_to_dataframe(result_set)
 
+    def _get_jdbc_dialect(self):
+        """
+        Returns ``org.apache.spark.sql.jdbc.JdbcDialect`` for current JDBC URL.
+
+        Dialect lookup iterates over all registered dialects on JVM side, so result is cached.
+        """
+
+        if self._jdbc_dialect is None:
+            jdbc_dialects_package = self.spark._jvm.org.apache.spark.sql.jdbc  # type: ignore
+            self._jdbc_dialect = jdbc_dialects_package.JdbcDialects.get(self.jdbc_url)
+
+        return self._jdbc_dialect
+
     def _resultset_to_dataframe(self, result_set) -> DataFrame:
         """
         Converts ``java.sql.ResultSet`` to ``org.apache.spark.sql.DataFrame`` using Spark's internal methods.
@@ -640,8 +680,7 @@ class JDBCMixin(FrozenModel):
 
         from pyspark.sql import DataFrame  # noqa: WPS442
 
-        jdbc_dialects_package = self.spark._jvm.org.apache.spark.sql.jdbc  # type: ignore
-        jdbc_dialect = jdbc_dialects_package.JdbcDialects.get(self.jdbc_url)
+        jdbc_dialect = self._get_jdbc_dialect()
 
         jdbc_utils_package = self.spark._jvm.org.apache.spark.sql.execution.datasources.jdbc  # type: ignore
         jdbc_utils = jdbc_utils_package.JdbcUtils
@@ -20,11 +20,20 @@ import operator
 import warnings
 from datetime import datetime
 from enum import Enum
-from typing import TYPE_CHECKING, Any, Callable, ClassVar, Dict, Iterable, Mapping
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    Callable,
+    ClassVar,
+    Dict,
+    Iterable,
+    Mapping,
+    Optional,
+)
 from urllib import parse as parser
 
 from etl_entities.instance import Host
-from pydantic import Field, SecretStr, root_validator, validator
+from pydantic import Field, PrivateAttr, SecretStr, root_validator, validator
 
 from onetl._util.classproperty import classproperty
 from onetl._util.java import try_import_java_class
@@ -273,6 +282,9 @@ class MongoDB(DBConnection):
     port: int = 27017
     extra: Extra = Extra()
 
+    # connection is immutable, so connection URL can be built only once
+    _connection_url: Optional[str] = PrivateAttr(default=None)
+
     @slot
     @classmethod
     def get_packages(
@@ -911,6 +923,19 @@ class MongoDB(DBConnection):
 
     @property
     def connection_url(self) -> str:
+        if self._connection_url is None:
+            self._connection_url = self._build_connection_url()
+
+        return self._connection_url
+
+    def copy(self, *, update: dict | None = None, **kwargs) -> MongoDB:
+        result = super().copy(update=update, **kwargs)
+        if update:
+            # connection URL depends on connection attributes, so it cannot be reused by the copy
+            result._connection_url = None
+        return result
+
+    def _build_connection_url(self) -> str:
         prop = self.extra.dict(by_alias=True)
         parameters = "&".join(f"{k}={v}" for k, v in sorted(prop.items()))
         parameters = "?" + parameters if parameters else ""
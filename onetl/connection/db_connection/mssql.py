@@ -223,10 +223,10 @@ class MSSQL(JDBCConnection):
             return f"CAST('{result}' AS date)"
 
     class ReadOptions(JDBCConnection.ReadOptions):
-        # https://docs.microsoft.com/ru-ru/sql/t-sql/functions/hashbytes-transact-sql?view=sql-server-ver16
+        # https://learn.microsoft.com/en-us/sql/t-sql/functions/checksum-transact-sql?view=sql-server-ver16
         @classmethod
         def _get_partition_column_hash(cls, partition_column: str, num_partitions: int) -> str:
-            return f"CONVERT(BIGINT, HASHBYTES ( 'SHA' , {partition_column} )) % {num_partitions}"
+            return f"ABS(CAST(CHECKSUM({partition_column}) AS BIGINT)) % {num_partitions}"
 
         @classmethod
         def _get_partition_column_mod(cls, partition_column: str, num_partitions: int) -> str:
@@ -234,8 +234,7 @@ class MSSQL(JDBCConnection):
 
     ReadOptions.__doc__ = JDBCConnection.ReadOptions.__doc__
 
-    @property
-    def jdbc_url(self) -> str:
+    def _build_jdbc_url(self) -> str:
         prop = self.extra.dict(by_alias=True)
         prop["databaseName"] = self.database
         parameters = ";".join(f"{k}={v}" for k, v in sorted(prop.items()))
@@ -87,6 +87,19 @@ class MySQL(JDBCConnection):
         <https://dev.mysql.com/doc/connector-j/8.0/en/connector-j-reference-configuration-properties.html>`_
         for more details
 
+        .. note::
+
+            By default, these options are added to extra:
+
+                * ``useUnicode = "yes"``
+                * ``characterEncoding = "UTF-8"``
+                * ``rewriteBatchedStatements = "true"``
+                * ``cachePrepStmts = "true"``
+                * ``prepStmtCacheSize = "250"``
+                * ``useCursorFetch = "true"``
+
+            It is possible to override default values, for example set ``extra={"rewriteBatchedStatements": "false"}``
+
     Examples
     --------
 
@@ -119,6 +132,13 @@ class MySQL(JDBCConnection):
     class Extra(JDBCConnection.Extra):
         useUnicode: str = "yes"  # noqa: N815
         characterEncoding: str = "UTF-8"  # noqa: N815
+        # combine rows inserted by Spark in one batch into multi-row INSERT statements
+        rewriteBatchedStatements: str = "true"  # noqa: N815
+        # do not parse the same statement again if it was already prepared by the same connection
+        cachePrepStmts: str = "true"  # noqa: N815
+        prepStmtCacheSize: str = "250"  # noqa: N815
+        # without this option driver ignores fetchsize, and loads the entire result set into memory
+        useCursorFetch: str = "true"  # noqa: N815
 
     port: int = 3306
     database: Optional[str] = None
@@ -151,8 +171,7 @@ class MySQL(JDBCConnection):
         warnings.warn(msg, UserWarning, stacklevel=3)
         return "com.mysql:mysql-connector-j:8.0.33"
 
-    @property
-    def jdbc_url(self):
+    def _build_jdbc_url(self) -> str:
         prop = self.extra.dict(by_alias=True)
         parameters = "&".join(f"{k}={v}" for k, v in sorted(prop.items()))
 
@@ -164,18 +183,22 @@ class MySQL(JDBCConnection):
     class Dialect(JDBCConnection.Dialect):
         @classmethod
         def _get_datetime_value_sql(cls, value: datetime) -> str:
-            result = value.strftime("%Y-%m-%d %H:%M:%S.%f")
+            result = (
+                f"{value.year:04d}-{value.month:02d}-{value.day:02d} "
+                f"{value.hour:02d}:{value.minute:02d}:{value.second:02d}.{value.microsecond:06d}"
+            )
             return f"STR_TO_DATE('{result}', '%Y-%m-%d %H:%i:%s.%f')"
 
         @classmethod
         def _get_date_value_sql(cls, value: date) -> str:
-            result = value.strftime("%Y-%m-%d")
+            result = value.isoformat()
             return f"STR_TO_DATE('{result}', '%Y-%m-%d')"
 
     class ReadOptions(JDBCConnection.ReadOptions):
+        # https://dev.mysql.com/doc/refman/8.0/en/mathematical-functions.html#function_crc32
         @classmethod
         def _get_partition_column_hash(cls, partition_column: str, num_partitions: int) -> str:
-            return f"MOD(CONV(CONV(RIGHT(MD5({partition_column}), 16),16, 2), 2, 10), {num_partitions})"
+            return f"MOD(CRC32(CAST({partition_column} AS CHAR)), {num_partitions})"
 
         @classmethod
         def _get_partition_column_mod(cls, partition_column: str, num_partitions: int) -> str:
@@ -232,12 +232,15 @@ class Oracle(JDBCConnection):
     class Dialect(JDBCConnection.Dialect):
         @classmethod
         def _get_datetime_value_sql(cls, value: datetime) -> str:
-            result = value.strftime("%Y-%m-%d %H:%M:%S")
+            result = (
+                f"{value.year:04d}-{value.month:02d}-{value.day:02d} "
+                f"{value.hour:02d}:{value.minute:02d}:{value.second:02d}"
+            )
             return f"TO_DATE('{result}', 'YYYY-MM-DD HH24:MI:SS')"
 
         @classmethod
         def _get_date_value_sql(cls, value: date) -> str:
-            result = value.strftime("%Y-%m-%d")
+            result = value.isoformat()
             return f"TO_DATE('{result}', 'YYYY-MM-DD')"
 
     class ReadOptions(JDBCConnection.ReadOptions):
@@ -251,8 +254,7 @@ class Oracle(JDBCConnection):
 
     ReadOptions.__doc__ = JDBCConnection.ReadOptions.__doc__
 
-    @property
-    def jdbc_url(self) -> str:
+    def _build_jdbc_url(self) -> str:
         extra = self.extra.dict(by_alias=True)
         parameters = "&".join(f"{k}={v}" for k, v in sorted(extra.items()))
 
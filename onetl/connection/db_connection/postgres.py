@@ -98,6 +98,14 @@ class Postgres(JDBCConnection):
         See `Postgres JDBC driver properties documentation <https://github.com/pgjdbc/pgjdbc#connection-properties>`_
         for more details
 
+        .. note::
+
+            By default, these options are added to extra:
+
+                * ``reWriteBatchedInserts = "true"``
+
+            It is possible to override default values, for example set ``extra={"reWriteBatchedInserts": "false"}``
+
     Examples
     --------
 
@@ -128,8 +136,13 @@ class Postgres(JDBCConnection):
 
     """
 
+    class Extra(JDBCConnection.Extra):
+        # combine rows inserted by Spark in one batch into multi-row INSERT statements
+        reWriteBatchedInserts: str = "true"  # noqa: N815
+
     database: str
     port: int = 5432
+    extra: Extra = Extra()
 
     DRIVER: ClassVar[str] = "org.postgresql.Driver"
 
@@ -190,8 +203,7 @@ class Postgres(JDBCConnection):
 
     ReadOptions.__doc__ = JDBCConnection.ReadOptions.__doc__
 
-    @property
-    def jdbc_url(self) -> str:
+    def _build_jdbc_url(self) -> str:
         extra = self.extra.dict(by_alias=True)
         extra["ApplicationName"] = extra.get("ApplicationName", self.spark.sparkContext.appName)
 
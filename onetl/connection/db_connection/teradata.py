@@ -173,8 +173,7 @@ class Teradata(JDBCConnection):
         warnings.warn(msg, UserWarning, stacklevel=3)
         return "com.teradata.jdbc:terajdbc:17.20.00.15"
 
-    @property
-    def jdbc_url(self) -> str:
+    def _build_jdbc_url(self) -> str:
         prop = self.extra.dict(by_alias=True)
 
         if self.database:
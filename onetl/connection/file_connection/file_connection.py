@@ -17,8 +17,10 @@ from __future__ import annotations
 import os
 import threading
 from abc import abstractmethod
+from concurrent.futures import Executor
+from contextlib import closing, nullcontext
 from logging import getLogger
-from typing import Any, Iterable, Iterator
+from typing import Any, ContextManager, Iterable, Iterator
 
 from humanize import naturalsize
 
@@ -72,8 +74,10 @@ class FileConnection(BaseFileConnection, FrozenModel):
             if client and not self._is_client_closed(client):
                 return client
         except AttributeError:
-            self._clients_cache.client = self._get_client()
-            return self._clients_cache.client
+            pass
+
+        self._clients_cache.client = self._get_client()
+        return self._clients_cache.client
 
     @slot
     def close(self):
@@ -340,10 +344,10 @@ class FileConnection(BaseFileConnection, FrozenModel):
         log.debug("|%s| Uploading local file '%s' to '%s'", self.__class__.__name__, local_file_path, remote_file_path)
 
         local_file = LocalPath(local_file_path)
-        if not local_file.exists():
-            raise FileNotFoundError(f"File '{local_file}' does not exist")
-
         if not local_file.is_file():
+            if not local_file.exists():
+                raise FileNotFoundError(f"File '{local_file}' does not exist")
+
             raise NotAFileError(f"{path_repr(local_file)} is not a file")
 
         remote_file = RemotePath(remote_file_path)
@@ -438,7 +442,8 @@ class FileConnection(BaseFileConnection, FrozenModel):
 
         filters = filters or []
         limits = reset_limits(limits or [])
-        yield from self._walk(root_dir, topdown=topdown, filters=filters, limits=limits)
+        with self._get_walk_executor() as executor:
+            yield from self._walk(root_dir, topdown=topdown, filters=filters, limits=limits, executor=executor)
 
     @slot
     def remove_dir(self, path: os.PathLike | str, recursive: bool = False) -> bool:
@@ -477,6 +482,8 @@ class FileConnection(BaseFileConnection, FrozenModel):
         topdown: bool,
         filters: Iterable[BaseFileFilter],
         limits: Iterable[BaseFileLimit],
+        entries: list | None = None,
+        executor: Executor | None = None,
     ) -> Iterator[tuple[RemoteDirectory, list[RemoteDirectory], list[RemoteFile]]]:
         # no need to check nested directories if limit is already reached
         if limits_reached(limits):
@@ -485,13 +492,22 @@ class FileConnection(BaseFileConnection, FrozenModel):
         log.debug("|%s| Walking through directory '%s'", self.__class__.__name__, root)
         dirs, files = [], []
 
-        for entry in self._scan_entries(root):
+        if entries is None:
+            entries = self._scan_entries(root)
+
+        for entry in entries:
             name = self._extract_name_from_entry(entry)
             stat = self._extract_stat_from_entry(root, entry)
 
             if self._is_dir_entry(root, entry):
                 if not topdown:
-                    yield from self._walk(root=root / name, topdown=topdown, filters=filters, limits=limits)
+                    yield from self._walk(
+                        root=root / name,
+                        topdown=topdown,
+                        filters=filters,
+                        limits=limits,
+                        executor=executor,
+                    )
 
                 path = RemoteDirectory(path=root / name, stats=stat)
                 if match_all_filters(path, filters):
@@ -509,8 +525,20 @@ class FileConnection(BaseFileConnection, FrozenModel):
                         break
 
         if topdown:
-            for name in dirs:
-                yield from self._walk(root=root / name, topdown=topdown, filters=filters, limits=limits)
+            nested_entries = self._scan_entries_many([root / name for name in dirs], executor=executor)
+            with closing(nested_entries):
+                for name in dirs:
+                    if limits_reached(limits):
+                        break
+
+                    yield from self._walk(
+                        root=root / name,
+                        topdown=topdown,
+                        filters=filters,
+                        limits=limits,
+                        entries=next(nested_entries),
+                        executor=executor,
+                    )
 
         log.debug(
             "|%s| Directory '%s' contains %d nested directories and %d files",
@@ -734,6 +762,23 @@ class FileConnection(BaseFileConnection, FrozenModel):
         Create and return underlying client.
         """
 
+    def _get_walk_executor(self) -> ContextManager[Executor | None]:
+        """
+        Return executor shared by all the levels of :obj:`~walk`.
+
+        By default executor is not used.
+        """
+        return nullcontext()
+
+    def _scan_entries_many(self, paths: list[RemotePath], executor: Executor | None = None) -> Iterator[list]:
+        """
+        Return entries of each directory from the list, preserving the order.
+
+        By default directories are scanned lazily, one by one.
+        """
+        for path in paths:
+            yield self._scan_entries(path)
+
     @abstractmethod
     def _is_client_closed(self, client: Any) -> bool:
         """
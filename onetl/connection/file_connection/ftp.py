@@ -17,11 +17,16 @@ from __future__ import annotations
 import ftplib  # noqa: S402
 import os
 import textwrap
+import time
+from contextlib import suppress
+from io import BytesIO
 from logging import getLogger
-from typing import Optional
+from stat import S_ISDIR, S_ISREG
+from typing import Any, ClassVar, Optional, Tuple
+from weakref import WeakKeyDictionary
 
 from etl_entities.instance import Host
-from pydantic import SecretStr
+from pydantic import PrivateAttr, SecretStr
 
 from onetl.base import PathStatProtocol
 from onetl.connection.file_connection.file_connection import FileConnection
@@ -33,6 +38,7 @@ from onetl.impl.remote_path_stat import RemotePathStat
 try:
     from ftputil import FTPHost
     from ftputil import session as ftp_session
+    from ftputil.error import FTPOSError, ftplib_error_to_ftp_os_error
 except (ImportError, NameError) as e:
     raise ImportError(
         textwrap.dedent(
@@ -49,6 +55,7 @@ except (ImportError, NameError) as e:
     ) from e
 
 log = getLogger(__name__)
+ENTRY_TYPE = Tuple[str, PathStatProtocol]
 
 
 @support_hooks
@@ -109,6 +116,13 @@ class FTP(FileConnection, RenameDirMixin):
     user: Optional[str] = None
     password: Optional[SecretStr] = None
 
+    # servers drop control connection after some time of inactivity (vsftpd - 300 seconds by default)
+    _KEEP_ALIVE_INTERVAL: ClassVar[float] = 30
+    _clients_last_used: Any = PrivateAttr(default_factory=WeakKeyDictionary)
+
+    # ftputil file objects read data by 8KiB chunks, use larger blocks for reading & writing whole files
+    _TRANSFER_BLOCK_SIZE: ClassVar[int] = 1024 * 1024
+
     @property
     def instance_url(self) -> str:
         return f"ftp://{self.host}:{self.port}"
@@ -129,15 +143,37 @@ class FTP(FileConnection, RenameDirMixin):
             debug_level=0,
         )
 
-        return FTPHost(
+        client = FTPHost(
             self.host,
             self.user,
             self.password.get_secret_value() if self.password else None,
             session_factory=session_factory,
         )
+        self._clients_last_used[client] = time.monotonic()
+        return client
 
     def _is_client_closed(self, client: FTPHost) -> bool:
-        return client.closed
+        if client.closed:
+            return True
+
+        now = time.monotonic()
+        last_used = self._clients_last_used.get(client, now)
+        self._clients_last_used[client] = now
+        if now - last_used < self._KEEP_ALIVE_INTERVAL:
+            return False
+
+        # client was idle for a while, check if control connection is still alive before reusing it
+        try:
+            client.keep_alive()
+        except FTPOSError:
+            log.debug("|%s| Connection was closed by server, reconnecting...", self.__class__.__name__)
+            # client will be replaced with a new one, so release its sessions and sockets
+            with suppress(Exception):
+                client.close()
+            self._clients_last_used.pop(client, None)
+            return True
+
+        return False
 
     def _close_client(self, client: FTPHost) -> None:
         client.close()
@@ -162,8 +198,12 @@ class FTP(FileConnection, RenameDirMixin):
     def _create_dir(self, path: RemotePath) -> None:
         self.client.makedirs(os.fspath(path), exist_ok=True)
 
-    def _scan_entries(self, path: RemotePath) -> list[str]:
-        return self.client.listdir(os.fspath(path))
+    def _scan_entries(self, path: RemotePath) -> list[ENTRY_TYPE]:
+        # listdir sends only one LIST command, and caches stat of every entry,
+        # so calling stat for each entry does not produce any additional requests
+        path_str = os.fspath(path)
+        names = self.client.listdir(path_str)
+        return [(name, self.client.stat(self.client.path.join(path_str, name))) for name in names]
 
     def _is_dir(self, path: RemotePath) -> bool:
         return self.client.path.isdir(os.fspath(path))
@@ -172,37 +212,62 @@ class FTP(FileConnection, RenameDirMixin):
         return self.client.path.isfile(os.fspath(path))
 
     def _get_stat(self, path: RemotePath) -> PathStatProtocol:
-        if path == RemotePath("/"):
+        path_str = os.fspath(path)
+        if path_str == "/":
             # FTP does not allow to call stat on root directory, do nothing
             return RemotePathStat()
 
         # underlying FTP client already return `os.stat_result`-like class`
-        return self.client.stat(os.fspath(path))
+        return self.client.stat(path_str)
 
     def _read_text(self, path: RemotePath, encoding: str, **kwargs) -> str:
         with self.client.open(os.fspath(path), mode="r", encoding=encoding, **kwargs) as file:
             return file.read()
 
     def _read_bytes(self, path: RemotePath, **kwargs) -> bytes:
-        with self.client.open(os.fspath(path), mode="rb", **kwargs) as file:
-            return file.read()
+        if kwargs:
+            with self.client.open(os.fspath(path), mode="rb", **kwargs) as file:
+                return file.read()
+
+        # transfer file content directly using client session, without opening a file object in a child session
+        buffer = BytesIO()
+        with ftplib_error_to_ftp_os_error:
+            self.client._session.retrbinary(  # noqa: WPS437
+                f"RETR {os.fspath(path)}",
+                buffer.write,
+                blocksize=self._TRANSFER_BLOCK_SIZE,
+            )
+        return buffer.getvalue()
 
     def _write_text(self, path: RemotePath, content: str, encoding: str, **kwargs) -> None:
         with self.client.open(os.fspath(path), mode="w", encoding=encoding, **kwargs) as file:
             file.write(content)
 
     def _write_bytes(self, path: RemotePath, content: bytes, **kwargs) -> None:
-        with self.client.open(os.fspath(path), mode="wb", **kwargs) as file:
-            file.write(content)
+        if kwargs:
+            with self.client.open(os.fspath(path), mode="wb", **kwargs) as file:
+                file.write(content)
+            return
+
+        path_str = os.fspath(path)
+        with ftplib_error_to_ftp_os_error:
+            self.client._session.storbinary(  # noqa: WPS437
+                f"STOR {path_str}",
+                BytesIO(content),
+                blocksize=self._TRANSFER_BLOCK_SIZE,
+            )
+
+        # file size and modification time are changed, drop them from client cache
+        self.client.stat_cache.invalidate(self.client.path.abspath(path_str))
 
-    def _extract_name_from_entry(self, entry: str) -> str:
-        return entry
+    def _extract_name_from_entry(self, entry: ENTRY_TYPE) -> str:
+        return entry[0]
 
-    def _is_dir_entry(self, top: RemotePath, entry: str) -> bool:
-        return self._is_dir(top / entry)
+    def _is_dir_entry(self, top: RemotePath, entry: ENTRY_TYPE) -> bool:
+        return S_ISDIR(entry[1].st_mode)
 
-    def _is_file_entry(self, top: RemotePath, entry: str) -> bool:
-        return self._is_file(top / entry)
+    def _is_file_entry(self, top: RemotePath, entry: ENTRY_TYPE) -> bool:
+        return S_ISREG(entry[1].st_mode)
 
-    def _extract_stat_from_entry(self, top: RemotePath, entry: str) -> PathStatProtocol:
-        return self._get_stat(top / entry)
+    def _extract_stat_from_entry(self, top: RemotePath, entry: ENTRY_TYPE) -> PathStatProtocol:
+        return entry[1]
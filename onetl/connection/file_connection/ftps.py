@@ -14,6 +14,7 @@
 
 import ftplib  # NOQA: S402
 import textwrap
+import time
 
 from ftputil import FTPHost
 from ftputil import session as ftp_session
@@ -121,9 +122,11 @@ class FTPS(FTP):
             debug_level=0,
         )
 
-        return FTPHost(
+        client = FTPHost(
             self.host,
             self.user,
             self.password.get_secret_value() if self.password else None,
             session_factory=session_factory,
         )
+        self._clients_last_used[client] = time.monotonic()
+        return client
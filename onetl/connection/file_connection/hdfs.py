@@ -17,8 +17,13 @@ from __future__ import annotations
 import os
 import stat
 import textwrap
+import threading
+import time
+from collections import deque
+from concurrent.futures import Executor, Future, ThreadPoolExecutor
+from itertools import islice
 from logging import getLogger
-from typing import TYPE_CHECKING, Optional, Tuple
+from typing import TYPE_CHECKING, ClassVar, ContextManager, Iterator, Optional, Tuple
 
 from etl_entities.instance import Cluster, Host
 from pydantic import Field, FilePath, SecretStr, root_validator, validator
@@ -27,8 +32,20 @@ from onetl.base import PathStatProtocol
 from onetl.connection.file_connection.file_connection import FileConnection
 from onetl.connection.file_connection.mixins.rename_dir_mixin import RenameDirMixin
 from onetl.connection.kerberos_helpers import kinit
+from onetl.exception import (
+    DirectoryNotEmptyError,
+    DirectoryNotFoundError,
+    NotAFileError,
+)
 from onetl.hooks import slot, support_hooks
-from onetl.impl import LocalPath, RemotePath, RemotePathStat
+from onetl.impl import (
+    LocalPath,
+    RemoteDirectory,
+    RemoteFile,
+    RemotePath,
+    RemotePathStat,
+    path_repr,
+)
 
 try:
     from hdfs import Client, InsecureClient
@@ -53,6 +70,11 @@ except (ImportError, NameError) as err:
 log = getLogger(__name__)
 ENTRY_TYPE = Tuple[str, dict]
 
+# Kerberos ticket cache is shared by the whole process, so the last kinit call is tracked globally.
+# kinit can be skipped only if the ticket in cache was obtained for the same principal and keytab
+_last_kinit: Optional[Tuple[tuple, float]] = None
+_last_kinit_lock = threading.Lock()
+
 
 @support_hooks
 class HDFS(FileConnection, RenameDirMixin):
@@ -481,6 +503,14 @@ class HDFS(FileConnection, RenameDirMixin):
     keytab: Optional[FilePath] = None
     timeout: int = 10
 
+    # max number of WebHDFS requests sent in parallel while walking through directories tree.
+    # should not exceed connection pool size of requests.Session (10 by default)
+    _WALK_MAX_WORKERS: ClassVar[int] = 10
+
+    # Kerberos ticket obtained by kinit is valid for hours, so there is no need
+    # to call kinit (which spawns a new process) each time new client is created, e.g. in each thread
+    _KINIT_INTERVAL: ClassVar[float] = 5 * 60
+
     @validator("user", pre=True)
     def validate_packages(cls, user):
         if user:
@@ -630,6 +660,111 @@ class HDFS(FileConnection, RenameDirMixin):
     def path_exists(self, path: os.PathLike | str) -> bool:
         return self.client.status(os.fspath(path), strict=False)
 
+    # methods below are overridden to fetch path status only once instead of 2-3 requests to WebHDFS
+
+    @slot
+    def is_file(self, path: os.PathLike | str) -> bool:
+        remote_path = RemotePath(path)
+        status = self.client.status(os.fspath(remote_path), strict=False)
+        if not status:
+            raise FileNotFoundError(f"File '{remote_path}' does not exist")
+
+        return status["type"] == "FILE"
+
+    @slot
+    def is_dir(self, path: os.PathLike | str) -> bool:
+        remote_path = RemotePath(path)
+        status = self.client.status(os.fspath(remote_path), strict=False)
+        if not status:
+            raise DirectoryNotFoundError(f"Directory '{remote_path}' does not exist")
+
+        return status["type"] == "DIRECTORY"
+
+    @slot
+    def resolve_dir(self, path: os.PathLike | str) -> RemoteDirectory:
+        remote_path = RemotePath(path)
+        status = self.client.status(os.fspath(remote_path), strict=False)
+        if not status:
+            raise DirectoryNotFoundError(f"Directory '{remote_path}' does not exist")
+
+        path_stat = self._status_to_stat(status)
+        if status["type"] != "DIRECTORY":
+            raise NotADirectoryError(
+                f"{path_repr(RemoteFile(path, stats=path_stat))} is not a directory",
+            )
+
+        return RemoteDirectory(path=path, stats=path_stat)
+
+    @slot
+    def resolve_file(self, path: os.PathLike | str) -> RemoteFile:
+        remote_path = RemotePath(path)
+        status = self.client.status(os.fspath(remote_path), strict=False)
+        if not status:
+            raise FileNotFoundError(f"File '{remote_path}' does not exist")
+
+        remote_file = RemoteFile(path=path, stats=self._status_to_stat(status))
+        if status["type"] != "FILE":
+            raise NotAFileError(f"{path_repr(remote_file)} is not a file")
+
+        return remote_file
+
+    @slot
+    def remove_file(self, path: os.PathLike | str) -> bool:
+        log.debug("|%s| Removing file '%s'", self.__class__.__name__, path)
+        remote_path = RemotePath(path)
+
+        status = self.client.status(os.fspath(remote_path), strict=False)
+        if not status:
+            log.debug("|%s| File '%s' does not exist, nothing to remove", self.__class__.__name__, path)
+            return False
+
+        remote_file = RemoteFile(path=path, stats=self._status_to_stat(status))
+        if status["type"] != "FILE":
+            raise NotAFileError(f"{path_repr(remote_file)} is not a file")
+
+        log.debug("|%s| File to remove: %s", self.__class__.__name__, path_repr(remote_file))
+        self._remove_file(remote_file)
+        log.info("|%s| Successfully removed file '%s'", self.__class__.__name__, remote_file)
+        return True
+
+    @slot
+    def remove_dir(self, path: os.PathLike | str, recursive: bool = False) -> bool:
+        description = "RECURSIVELY" if recursive else "NON-recursively"
+        log.debug("|%s| %s removing directory '%s'", self.__class__.__name__, description, path)
+        remote_path = RemotePath(path)
+
+        status = self.client.status(os.fspath(remote_path), strict=False)
+        if not status:
+            log.debug(
+                "|%s| Directory '%s' does not exist, nothing to remove",
+                self.__class__.__name__,
+                remote_path,
+            )
+            return False
+
+        path_stat = self._status_to_stat(status)
+        if status["type"] != "DIRECTORY":
+            raise NotADirectoryError(
+                f"{path_repr(RemoteFile(path, stats=path_stat))} is not a directory",
+            )
+
+        directory_info = path_repr(RemoteDirectory(path=path, stats=path_stat))
+        if not recursive:
+            # "childrenNum" is returned since Hadoop 2.x, fallback to listing for older versions
+            children_num = status.get("childrenNum")
+            is_empty = not self._scan_entries(remote_path) if children_num is None else children_num == 0
+            if not is_empty:
+                raise DirectoryNotEmptyError(
+                    f"|{self.__class__.__name__}| Cannot delete non-empty directory {directory_info}",
+                )
+
+        log.debug("|%s| Directory to remove: %s", self.__class__.__name__, directory_info)
+
+        # WebHDFS removes the whole tree in one request, no need to walk through it
+        self.client.delete(os.fspath(remote_path), recursive=recursive)
+        log.info("|%s| Successfully removed directory '%s'", self.__class__.__name__, remote_path)
+        return True
+
     def _get_active_namenode(self) -> str:
         class_name = self.__class__.__name__
         log.info("|%s| Detecting active namenode of cluster %r ...", class_name, self.cluster)
@@ -680,11 +815,7 @@ class HDFS(FileConnection, RenameDirMixin):
         if self.user and (self.keytab or self.password):
             from hdfs.ext.kerberos import KerberosClient  # noqa: F811
 
-            kinit(
-                self.user,
-                keytab=self.keytab,
-                password=self.password.get_secret_value() if self.password else None,
-            )
+            self._kinit()
             client = KerberosClient(conn_str, timeout=self.timeout)
         else:
             from hdfs import InsecureClient  # noqa: F401, WPS442, F811
@@ -693,11 +824,32 @@ class HDFS(FileConnection, RenameDirMixin):
 
         return client
 
+    def _kinit(self) -> None:
+        global _last_kinit  # noqa: WPS420
+
+        key = (self.user, os.fspath(self.keytab) if self.keytab else None, os.environ.get("KRB5CCNAME"))
+        with _last_kinit_lock:
+            now = time.monotonic()
+            if _last_kinit is not None:
+                last_key, last_time = _last_kinit
+                if last_key == key and now - last_time < self._KINIT_INTERVAL:
+                    log.debug("|%s| Kerberos ticket was obtained recently, skipping kinit", self.__class__.__name__)
+                    return
+
+            kinit(
+                self.user,
+                keytab=self.keytab,
+                password=self.password.get_secret_value() if self.password else None,
+            )
+            _last_kinit = (key, now)
+
     def _is_client_closed(self, client: Client):
         return False
 
     def _close_client(self, client: Client) -> None:  # NOSONAR
-        pass
+        # client uses requests.Session which keeps HTTP connections to WebHDFS alive between calls,
+        # they should be closed explicitly
+        client._session.close()  # noqa: WPS437
 
     def _remove_dir(self, path: RemotePath) -> None:
         self.client.delete(os.fspath(path), recursive=False)
@@ -722,6 +874,42 @@ class HDFS(FileConnection, RenameDirMixin):
     def _scan_entries(self, path: RemotePath) -> list[ENTRY_TYPE]:
         return self.client.list(os.fspath(path), status=True)
 
+    def _get_walk_executor(self) -> ContextManager[Executor | None]:
+        if self.user and (self.keytab or self.password):
+            # auth object of KerberosClient is not thread-safe, so it cannot be shared with workers
+            return super()._get_walk_executor()
+
+        # the same pool is used by all levels of directories tree, so number of threads is always limited
+        return ThreadPoolExecutor(max_workers=self._WALK_MAX_WORKERS, thread_name_prefix="hdfs-walk")
+
+    def _scan_entries_many(
+        self,
+        paths: list[RemotePath],
+        executor: Executor | None = None,
+    ) -> Iterator[list[ENTRY_TYPE]]:
+        if executor is None or len(paths) < 2:
+            yield from super()._scan_entries_many(paths, executor=executor)
+            return
+
+        # WebHDFS requests are network-bound, so send them in parallel.
+        # Client of current thread is shared with workers to avoid creating new connections.
+        # Only a few directories are requested in advance, so if limit is reached, remaining ones are not scanned at all
+        client = self.client
+        paths_iter = iter(paths)
+        pending: deque[Future] = deque(
+            executor.submit(client.list, os.fspath(path), status=True)
+            for path in islice(paths_iter, self._WALK_MAX_WORKERS)
+        )
+        try:
+            while pending:
+                future = pending.popleft()
+                for path in islice(paths_iter, 1):
+                    pending.append(executor.submit(client.list, os.fspath(path), status=True))
+                yield future.result()
+        finally:
+            for future in pending:
+                future.cancel()
+
     def _is_file(self, path: RemotePath) -> bool:
         return self.client.status(os.fspath(path))["type"] == "FILE"
 
@@ -730,7 +918,9 @@ class HDFS(FileConnection, RenameDirMixin):
 
     def _get_stat(self, path: RemotePath) -> RemotePathStat:
         status = self.client.status(os.fspath(path))
+        return self._status_to_stat(status)
 
+    def _status_to_stat(self, status: dict) -> RemotePathStat:
         # Status examples:
         # {
         #   "accessTime"      : 1320171722771,
@@ -798,12 +988,4 @@ class HDFS(FileConnection, RenameDirMixin):
     def _extract_stat_from_entry(self, top: RemotePath, entry: ENTRY_TYPE) -> PathStatProtocol:
         entry_stat = entry[1]
 
-        return RemotePathStat(
-            st_size=entry_stat["length"],
-            st_mtime=entry_stat["modificationTime"] / 1000,  # HDFS uses timestamps with milliseconds
-            st_uid=entry_stat["owner"],
-            st_gid=entry_stat["group"],
-            st_mode=int(entry_stat["permission"], 8) | stat.S_IFDIR
-            if entry_stat["type"] == "DIRECTORY"
-            else stat.S_IFREG,
-        )
+        return self._status_to_stat(entry_stat)
@@ -186,6 +186,13 @@ class SparkHDFS(SparkFileDFConnection):
     def instance_url(self):
         return self.cluster
 
+    def copy(self, *, update: dict | None = None, **kwargs) -> SparkHDFS:
+        result = super().copy(update=update, **kwargs)
+        if update:
+            # active namenode depends on cluster and host, so it cannot be reused by the copy
+            object.__setattr__(result, "_active_host", None)  # noqa: WPS609
+        return result
+
     def __enter__(self):
         return self
 
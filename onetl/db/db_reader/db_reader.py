@@ -1,11 +1,11 @@
 from __future__ import annotations
 
-from logging import getLogger
-from typing import TYPE_CHECKING, Any, List, Optional
+from logging import INFO, getLogger
+from typing import TYPE_CHECKING, Any, Dict, List, Optional, Tuple
 
 import frozendict
 from etl_entities import Column, Table
-from pydantic import Field, root_validator, validator
+from pydantic import Field, PrivateAttr, root_validator, validator
 
 from onetl._internal import uniq_ignore_case
 from onetl._util.spark import try_import_pyspark
@@ -24,6 +24,7 @@ from onetl.log import (
     log_options,
     log_with_indent,
 )
+from onetl.strategy.strategy_manager import StrategyManager
 
 log = getLogger(__name__)
 
@@ -341,6 +342,28 @@ class DBReader(FrozenModel):
     df_schema: Optional[StructType] = None
     options: Optional[GenericOptions] = None
 
+    # values calculated during current run() call, to avoid fetching table schema multiple times.
+    # bound to the strategy used by this call, see _get_run_cache
+    _run_cache: Optional[Dict[str, Any]] = PrivateAttr(default=None)
+
+    # key used by __hash__, calculated once because model is immutable
+    _hash_key: Optional[Tuple[Any, ...]] = PrivateAttr(default=None)
+
+    def __hash__(self):
+        # default pydantic hash fails on list of columns, and should process all the fields on every call.
+        # __eq__ is still inherited from pydantic, so equal readers always have the same hash
+        if self._hash_key is None:
+            self._hash_key = self._get_hash_key()
+
+        return hash(self._hash_key)
+
+    def copy(self, *, update: dict | None = None, **kwargs) -> DBReader:
+        result = super().copy(update=update, **kwargs)
+        if update:
+            # hash key is calculated from fields, so it cannot be reused by the copy
+            result._hash_key = None
+        return result
+
     @validator("source", pre=True, always=True)
     def validate_source(cls, source, values):
         connection: BaseDBConnection = values["connection"]
@@ -478,9 +501,14 @@ class DBReader(FrozenModel):
             return self.df_schema
 
         if not self.df_schema and isinstance(self.connection, ContainsGetDFSchemaMethod):
+            columns = self._resolve_all_columns()
+            schema = self._get_cached_df_schema(columns)
+            if schema is not None:
+                return schema
+
             return self.connection.get_df_schema(
                 source=str(self.source),
-                columns=self._resolve_all_columns(),
+                columns=columns,
                 **self._get_read_kwargs(),
             )
 
@@ -544,24 +572,29 @@ class DBReader(FrozenModel):
         self._log_parameters()
         self.connection.check()
 
-        helper: StrategyHelper
-        if self.hwm_column:
-            helper = HWMStrategyHelper(reader=self, hwm_column=self.hwm_column, hwm_expression=self.hwm_expression)
-        else:
-            helper = NonHWMStrategyHelper(reader=self)
-
-        start_from, end_at = helper.get_boundaries()
-
-        df = self.connection.read_source_as_df(
-            source=str(self.source),
-            columns=self._resolve_all_columns(),
-            hint=self.hint,
-            where=self.where,
-            df_schema=self.df_schema,
-            start_from=start_from,
-            end_at=end_at,
-            **self._get_read_kwargs(),
-        )
+        # "*" is unwrapped only once, and then reused both for detecting HWM type and reading data
+        self._run_cache = {"strategy": self._get_strategy_key()}
+        try:
+            helper: StrategyHelper
+            if self.hwm_column:
+                helper = HWMStrategyHelper(reader=self, hwm_column=self.hwm_column, hwm_expression=self.hwm_expression)
+            else:
+                helper = NonHWMStrategyHelper(reader=self)
+
+            start_from, end_at = helper.get_boundaries()
+
+            df = self.connection.read_source_as_df(
+                source=str(self.source),
+                columns=self._resolve_all_columns(),
+                hint=self.hint,
+                where=self.where,
+                df_schema=self.df_schema,
+                start_from=start_from,
+                end_at=end_at,
+                **self._get_read_kwargs(),
+            )
+        finally:
+            self._run_cache = None
 
         df = helper.save(df)
         entity_boundary_log(log, msg="DBReader ends", char="-")
@@ -569,6 +602,10 @@ class DBReader(FrozenModel):
         return df
 
     def _log_parameters(self) -> None:
+        if not log.isEnabledFor(INFO):
+            # do not create empty dataframe, serialize options and so on if nobody will see the result
+            return
+
         log.info("|%s| -> |Spark| Reading DataFrame from source using parameters:", self.connection.__class__.__name__)
         log_with_indent(log, "source = '%s'", self.source)
 
@@ -594,6 +631,29 @@ class DBReader(FrozenModel):
         options = self.options.dict(by_alias=True, exclude_none=True) if self.options else None
         log_options(log, options)
 
+    def _get_hash_key(self) -> tuple:
+        columns = tuple(self.columns) if self.columns else None
+        return (
+            self.connection.instance_url,
+            str(self.source),
+            columns,
+            self.hwm_column.name if self.hwm_column else None,
+            self.hwm_expression,
+            self._hashable_or_none(self.where),
+            self._hashable_or_none(self.hint),
+        )
+
+    @staticmethod
+    def _hashable_or_none(value: Any) -> Any:
+        # where and hint could contain nested dicts or lists (e.g. for MongoDB),
+        # skip them instead of failing. Equal readers still have the same hash
+        try:
+            hash(value)
+        except TypeError:
+            return None
+
+        return value
+
     def _resolve_all_columns(self) -> list[str] | None:
         """
         Unwraps "*" in columns list to real column names from existing table.
@@ -601,6 +661,35 @@ class DBReader(FrozenModel):
         Also adds 'hwm_column' to the result if it is not present.
         """
 
+        run_cache = self._get_run_cache()
+        if run_cache is None:
+            return self._get_all_columns()
+
+        if "columns" not in run_cache:
+            run_cache["columns"] = self._get_all_columns()
+
+        return run_cache["columns"]
+
+    def _get_run_cache(self) -> dict | None:
+        """
+        Return values cached by current run() call.
+
+        Strategy determines which HWM value and which table are used,
+        so cache is not used if reader is called within another strategy context.
+        """
+
+        if self._run_cache is None or self._run_cache["strategy"] != self._get_strategy_key():
+            return None
+
+        return self._run_cache
+
+    @staticmethod
+    def _get_strategy_key() -> tuple[int, int | None]:
+        # without any context default strategy is created on each get_current() call, so it cannot be compared by id
+        level = StrategyManager.get_current_level()
+        return level, id(StrategyManager.get_current()) if level else None
+
+    def _get_all_columns(self) -> list[str] | None:
         if not isinstance(self.connection, ContainsGetDFSchemaMethod):
             # Some databases have no `get_df_schema` method
             return self.columns
@@ -615,6 +704,10 @@ class DBReader(FrozenModel):
                     columns=["*"],
                     **self._get_read_kwargs(),
                 )
+                run_cache = self._get_run_cache()
+                if run_cache is not None:
+                    run_cache["schema"] = schema
+
                 field_names = schema.fieldNames()
                 columns.extend(field_names)
             else:
@@ -643,6 +736,25 @@ class DBReader(FrozenModel):
 
         return columns
 
+    def _get_cached_df_schema(self, columns: list[str] | None) -> StructType | None:
+        """
+        If table schema was already fetched by current run() call, and columns are just table fields,
+        build dataframe schema from it instead of sending one more query to the database.
+        """
+
+        run_cache = self._get_run_cache()
+        if not run_cache or "schema" not in run_cache or not columns:
+            return None
+
+        from pyspark.sql.types import StructType  # noqa: WPS442
+
+        table_fields = {field.name: field for field in run_cache["schema"]}
+        if not all(column in table_fields for column in columns):
+            # some of columns are expressions
+            return None
+
+        return StructType([table_fields[column] for column in columns])
+
     def _get_read_kwargs(self) -> dict:
         if self.options:
             return {"options": self.options}
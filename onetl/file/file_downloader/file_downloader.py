@@ -14,17 +14,19 @@
 
 from __future__ import annotations
 
+import errno
 import logging
 import os
 import shutil
+import threading
 import warnings
 from concurrent.futures import ThreadPoolExecutor, as_completed
+from contextlib import nullcontext, suppress
 from enum import Enum
-from typing import Iterable, List, Optional, Tuple, Type
+from typing import ContextManager, Dict, Iterable, Iterator, List, Optional, Tuple, Type
 
 from etl_entities import HWM, FileHWM, RemoteFolder
-from ordered_set import OrderedSet
-from pydantic import Field, root_validator, validator
+from pydantic import Field, PrivateAttr, root_validator, validator
 
 from onetl._internal import generate_temp_path
 from onetl.base import BaseFileConnection, BaseFileFilter, BaseFileLimit
@@ -58,8 +60,8 @@ from onetl.strategy.hwm_strategy import HWMStrategy
 
 log = logging.getLogger(__name__)
 
-# source, target, temp
-DOWNLOAD_ITEMS_TYPE = OrderedSet[Tuple[RemotePath, LocalPath, Optional[LocalPath]]]
+# source -> (target, temp). dict preserves insertion order and removes duplicated source files
+DOWNLOAD_ITEMS_TYPE = Dict[RemotePath, Tuple[LocalPath, Optional[LocalPath]]]
 
 
 class FileDownloadStatus(Enum):
@@ -240,6 +242,15 @@ class FileDownloader(FrozenModel):
         Recommended value is ``min(32, os.cpu_count() + 4)``, e.g. ``5``.
         """
 
+        hwm_save_interval: int = Field(default=100, ge=1)
+        """
+        Save HWM to HWM store after each N successfully downloaded files. Used only if ``hwm_type`` is set.
+
+        HWM is also saved after all files are downloaded.
+        If process was killed in the middle of download, up to N-1 already downloaded files
+        will be downloaded again in the next run.
+        """
+
         @root_validator(pre=True)
         def mode_is_deprecated(cls, values):
             if "mode" in values:
@@ -264,6 +275,8 @@ class FileDownloader(FrozenModel):
 
     options: Options = Options()
 
+    _hwm_unsaved_files: int = PrivateAttr(default=0)
+
     @slot
     def run(self, files: Iterable[str | os.PathLike] | None = None) -> DownloadResult:  # noqa: WPS231
         """
@@ -388,34 +401,38 @@ class FileDownloader(FrozenModel):
         self.connection.check()
         log_with_indent(log, "")
 
-        if self.source_path:
-            self._check_source_path()
-
         if files is None:
             log.info("|%s| File list is not passed to `run` method", self.__class__.__name__)
 
+            # view_files checks source_path and fetches HWM by itself, there is no need to do that twice.
+            # it is called as a slot, so hooks bound to view_files are executed as well
             files = self.view_files()
+        else:
+            if self.source_path:
+                self._check_source_path()
 
-        if not files:
-            log.info("|%s| No files to download!", self.__class__.__name__)
-            return DownloadResult()
+            if self.hwm_type:
+                self._init_hwm()
 
         current_temp_dir: LocalPath | None = None
         if self.temp_path:
             current_temp_dir = generate_temp_path(self.temp_path)
 
-        to_download = self._validate_files(files, current_temp_dir=current_temp_dir)
+        # the same workers are used for both checking and downloading files,
+        # so connection clients created by worker threads are reused between these steps
+        with self._get_executor() as executor:
+            to_download = self._validate_files(files, current_temp_dir=current_temp_dir, executor=executor)
+            if not to_download:
+                log.info("|%s| No files to download!", self.__class__.__name__)
+                return DownloadResult()
 
-        # remove folder only after everything is checked
-        if self.options.if_exists == FileExistBehavior.REPLACE_ENTIRE_DIRECTORY:
-            if self.local_path.exists():
-                shutil.rmtree(self.local_path)
-            self.local_path.mkdir()
+            # remove folder only after everything is checked
+            if self.options.if_exists == FileExistBehavior.REPLACE_ENTIRE_DIRECTORY:
+                if self.local_path.exists():
+                    shutil.rmtree(self.local_path)
+                self.local_path.mkdir()
 
-        if self.hwm_type is not None:
-            result = self._download_files_incremental(to_download)
-        else:
-            result = self._download_files(to_download)
+            result = self._download_files(to_download, executor=executor)
 
         if current_temp_dir:
             self._remove_temp_dir(current_temp_dir)
@@ -472,24 +489,24 @@ class FileDownloader(FrozenModel):
         log.debug("|%s| Getting files list from path '%s'", self.connection.__class__.__name__, self.source_path)
 
         self._check_source_path()
-        result = FileSet()
+        file_hwm = self._init_hwm() if self.hwm_type else None
+        return FileSet(self._iter_files(file_hwm))
 
+    def _iter_files(self, file_hwm: FileHWM | None = None) -> Iterator[RemoteFile]:
         filters = self.filters.copy()
-        if self.hwm_type:
-            filters.append(FileHWMFilter(hwm=self._init_hwm()))
+        if file_hwm is not None:
+            filters.append(FileHWMFilter(hwm=file_hwm))
 
         try:
             for root, _dirs, files in self.connection.walk(self.source_path, filters=filters, limits=self.limits):
                 for file in files:
-                    result.append(RemoteFile(path=root / file, stats=file.stats))
+                    yield RemoteFile(path=root / file, stats=file.stats)
 
         except Exception as e:
             raise RuntimeError(
                 f"Couldn't read directory tree from remote dir '{self.source_path}'",
             ) from e
 
-        return result
-
     @validator("local_path", pre=True, always=True)
     def _resolve_local_path(cls, local_path):
         return LocalPath(local_path).resolve()
@@ -586,20 +603,18 @@ class FileDownloader(FrozenModel):
         self._check_hwm_type(file_hwm.__class__)
         return file_hwm
 
-    def _download_files_incremental(self, to_download: DOWNLOAD_ITEMS_TYPE) -> DownloadResult:
-        self._init_hwm()
-        return self._download_files(to_download)
-
     def _log_parameters(self, files: Iterable[str | os.PathLike] | None = None) -> None:
-        entity_boundary_log(log, msg="FileDownloader starts")
-
-        log.info("|%s| -> |Local FS| Downloading files using parameters:", self.connection.__class__.__name__)
-        log_with_indent(log, "source_path = %s", f"'{self.source_path}'" if self.source_path else "None")
-        log_with_indent(log, "local_path = '%s'", self.local_path)
-        log_with_indent(log, "temp_path = %s", f"'{self.temp_path}'" if self.temp_path else "None")
-        log_collection(log, "filters", self.filters)
-        log_collection(log, "limits", self.limits)
-        log_options(log, self.options.dict(by_alias=True))
+        # do not serialize options and collections if they are not going to be logged anyway
+        if log.isEnabledFor(logging.INFO):
+            entity_boundary_log(log, msg="FileDownloader starts")
+
+            log.info("|%s| -> |Local FS| Downloading files using parameters:", self.connection.__class__.__name__)
+            log_with_indent(log, "source_path = %s", f"'{self.source_path}'" if self.source_path else "None")
+            log_with_indent(log, "local_path = '%s'", self.local_path)
+            log_with_indent(log, "temp_path = %s", f"'{self.temp_path}'" if self.temp_path else "None")
+            log_collection(log, "filters", self.filters)
+            log_collection(log, "limits", self.limits)
+            log_options(log, self.options.dict(by_alias=True))
 
         if self.options.delete_source:
             log.warning("|%s| SOURCE FILES WILL BE PERMANENTLY DELETED AFTER DOWNLOADING !!!", self.__class__.__name__)
@@ -617,8 +632,14 @@ class FileDownloader(FrozenModel):
         self,
         remote_files: Iterable[os.PathLike | str],
         current_temp_dir: LocalPath | None,
+        executor: ThreadPoolExecutor | None = None,
     ) -> DOWNLOAD_ITEMS_TYPE:
-        result: DOWNLOAD_ITEMS_TYPE = OrderedSet()
+        result: DOWNLOAD_ITEMS_TYPE = {}
+        to_resolve: list[RemotePath] = []
+
+        # comparing tuples of path parts is much cheaper than building a list of parents for every file
+        source_parts = self.source_path.parts if self.source_path else ()
+        source_depth = len(source_parts)
 
         for file in remote_files:
             remote_file_path = file if isinstance(file, PathProtocol) else RemotePath(file)
@@ -636,11 +657,13 @@ class FileDownloader(FrozenModel):
                     tmp_file = current_temp_dir / filename  # noqa: WPS220
             else:
                 # Download according to source folder structure
-                if self.source_path in remote_file_path.parents:
+                remote_file_parts = remote_file_path.parts
+                if len(remote_file_parts) > source_depth and remote_file_parts[:source_depth] == source_parts:
                     # Make relative local path
-                    local_file = self.local_path / remote_file_path.relative_to(self.source_path)
+                    relative_path = RemotePath(*remote_file_parts[source_depth:])
+                    local_file = self.local_path / relative_path
                     if current_temp_dir:
-                        tmp_file = current_temp_dir / remote_file_path.relative_to(self.source_path)  # noqa: WPS220
+                        tmp_file = current_temp_dir / relative_path  # noqa: WPS220
 
                 elif not remote_file_path.is_absolute():
                     # Passed path is already relative
@@ -652,12 +675,40 @@ class FileDownloader(FrozenModel):
                     # Wrong path (not relative path and source path not in the path to the file)
                     raise ValueError(f"File path '{remote_file}' does not match source_path '{self.source_path}'")
 
-            if not isinstance(remote_file, PathProtocol) and self.connection.path_exists(remote_file):
-                remote_file = self.connection.resolve_file(remote_file)
+            if not isinstance(remote_file, PathProtocol):
+                to_resolve.append(remote_file)
 
-            result.add((remote_file, local_file, tmp_file))
+            result[remote_file] = (local_file, tmp_file)
 
-        return result
+        if not to_resolve:
+            return result
+
+        resolved = self._resolve_files(to_resolve, executor)
+        return {resolved.get(remote_file, remote_file): targets for remote_file, targets in result.items()}
+
+    def _resolve_files(
+        self,
+        remote_files: list[RemotePath],
+        executor: ThreadPoolExecutor | None,
+    ) -> dict[RemotePath, RemoteFile]:
+        if executor:
+            # send requests in parallel, but raise exceptions in the same order as input files
+            resolved_files = executor.map(self._resolve_file, remote_files)
+        else:
+            resolved_files = map(self._resolve_file, remote_files)
+
+        return {
+            remote_file: resolved_file
+            for remote_file, resolved_file in zip(remote_files, resolved_files)
+            if resolved_file is not None
+        }
+
+    def _resolve_file(self, remote_file: RemotePath) -> RemoteFile | None:
+        # one request instead of path_exists + resolve_file. Missing files are handled while downloading
+        with suppress(FileNotFoundError):
+            return self.connection.resolve_file(remote_file)
+
+        return None
 
     def _check_source_path(self):
         self.connection.resolve_dir(self.source_path)
@@ -668,20 +719,42 @@ class FileDownloader(FrozenModel):
 
         self.local_path.mkdir(exist_ok=True, parents=True)
 
+    def _get_executor(self) -> ContextManager[ThreadPoolExecutor | None]:
+        if self.options.workers > 1:
+            return ThreadPoolExecutor(
+                max_workers=self.options.workers,
+                thread_name_prefix=self.__class__.__name__,
+            )
+
+        return nullcontext()
+
     def _download_files(
         self,
         to_download: DOWNLOAD_ITEMS_TYPE,
+        executor: ThreadPoolExecutor | None = None,
     ) -> DownloadResult:
-        files = FileSet(item[0] for item in to_download)
-        log.info("|%s| Files to be downloaded:", self.__class__.__name__)
-        log_lines(log, str(files))
-        log_with_indent(log, "")
+        if log.isEnabledFor(logging.INFO):
+            # building summary for a large file list is expensive, do not do that if nobody will see it
+            log.info("|%s| Files to be downloaded:", self.__class__.__name__)
+            log_lines(log, str(FileSet(to_download)))
+            log_with_indent(log, "")
+
         log.info("|%s| Starting the download process ...", self.__class__.__name__)
 
         self._create_dirs(to_download)
 
+        # HWM is shared between download workers.
+        # Lock is created for each run instead of storing it in the model, because locks cannot be copied or pickled
+        hwm_lock = threading.RLock()
+        try:
+            download_results = self._bulk_download(to_download, executor, hwm_lock)
+        finally:
+            # save HWM with all files downloaded since the last save, even if download was interrupted
+            if self.hwm_type and self._hwm_unsaved_files:
+                self._save_hwm(hwm_lock)
+
         result = DownloadResult()
-        for status, file in self._bulk_download(to_download):
+        for status, file in download_results:
             if status == FileDownloadStatus.SUCCESSFUL:
                 result.successful.add(file)
             elif status == FileDownloadStatus.FAILED:
@@ -701,8 +774,8 @@ class FileDownloader(FrozenModel):
         Create all parent paths before downloading files
         This is required to avoid errors then multiple threads create the same dir
         """
-        parent_paths = OrderedSet()
-        for _, target_file, tmp_file in to_download:
+        parent_paths = set()
+        for target_file, tmp_file in to_download.values():
             parent_paths.add(target_file.parent)
             if tmp_file:
                 parent_paths.add(tmp_file.parent)
@@ -713,28 +786,26 @@ class FileDownloader(FrozenModel):
     def _bulk_download(
         self,
         to_download: DOWNLOAD_ITEMS_TYPE,
+        executor: ThreadPoolExecutor | None,
+        hwm_lock: threading.RLock,
     ) -> list[tuple[FileDownloadStatus, PurePathProtocol | PathWithStatsProtocol]]:
-        workers = self.options.workers
         result = []
 
-        if workers > 1:
-            with ThreadPoolExecutor(
-                max_workers=max(workers, len(to_download)),
-                thread_name_prefix=self.__class__.__name__,
-            ) as executor:
-                futures = [
-                    executor.submit(self._download_file, source_file, target_file, tmp_file)
-                    for source_file, target_file, tmp_file in to_download
-                ]
-                for future in as_completed(futures):
-                    result.append(future.result())
+        if executor:
+            futures = [
+                executor.submit(self._download_file, source_file, target_file, tmp_file, hwm_lock)
+                for source_file, (target_file, tmp_file) in to_download.items()
+            ]
+            for future in as_completed(futures):
+                result.append(future.result())
         else:
-            for source_file, target_file, tmp_file in to_download:
+            for source_file, (target_file, tmp_file) in to_download.items():
                 result.append(
                     self._download_file(
                         source_file,
                         target_file,
                         tmp_file,
+                        hwm_lock,
                     ),
                 )
 
@@ -742,9 +813,10 @@ class FileDownloader(FrozenModel):
 
     def _download_file(  # noqa: WPS231, WPS213
         self,
-        source_file: RemotePath,
+        source_file: RemotePath | RemoteFile,
         local_file: LocalPath,
         tmp_file: LocalPath | None,
+        hwm_lock: threading.RLock,
     ) -> tuple[FileDownloadStatus, PurePathProtocol | PathWithStatsProtocol]:
         if tmp_file:
             log.info(
@@ -757,46 +829,47 @@ class FileDownloader(FrozenModel):
         else:
             log.info("|%s| Downloading file '%s' to '%s'", self.__class__.__name__, source_file, local_file)
 
-        if not self.connection.path_exists(source_file):
-            log.warning("|%s| Missing file '%s', skipping", self.__class__.__name__, source_file)
-            return FileDownloadStatus.MISSING, source_file
+        if isinstance(source_file, PathWithStatsProtocol):
+            # file was already resolved by view_files or _validate_files, do not send the same request again
+            remote_file = source_file
+        else:
+            try:
+                remote_file = self.connection.resolve_file(source_file)
+            except FileNotFoundError:
+                log.warning("|%s| Missing file '%s', skipping", self.__class__.__name__, source_file)
+                return FileDownloadStatus.MISSING, source_file
 
         try:
-            remote_file = self.connection.resolve_file(source_file)
-
-            replace = False
-            if local_file.exists():
+            # existing files are replaced by both connection.download_file and os.replace,
+            # so there is no need to check if target file exists
+            replace = self.options.if_exists in {
+                FileExistBehavior.REPLACE_FILE,
+                FileExistBehavior.REPLACE_ENTIRE_DIRECTORY,
+            }
+            if not replace and local_file.exists():
                 if self.options.if_exists == FileExistBehavior.ERROR:
                     raise FileExistsError(f"File {path_repr(local_file)} already exists")
 
-                if self.options.if_exists == FileExistBehavior.IGNORE:
-                    log.warning("|Local FS| File %s already exists, skipping", path_repr(local_file))
-                    return FileDownloadStatus.SKIPPED, remote_file
+                log.warning("|Local FS| File %s already exists, skipping", path_repr(local_file))
+                return FileDownloadStatus.SKIPPED, remote_file
 
-                replace = True
+            # Files are loaded to temporary directory before moving them to target dir.
+            # This prevents operations with partly downloaded files
+            try:
+                self.connection.download_file(remote_file, tmp_file or local_file, replace=replace)
+            except FileNotFoundError:
+                # file was removed from source after it was listed or resolved
+                log.warning("|%s| Missing file '%s', skipping", self.__class__.__name__, source_file)
+                return FileDownloadStatus.MISSING, source_file
 
             if tmp_file:
-                # Files are loaded to temporary directory before moving them to target dir.
-                # This prevents operations with partly downloaded files
-
-                self.connection.download_file(remote_file, tmp_file, replace=replace)
-
-                # remove existing file only after new file is downloaded
-                # to avoid issues then there is no free space to download new file, but existing one is already gone
-                if replace and local_file.exists():
-                    log.warning("|Local FS| File %s already exists, overwriting", path_repr(local_file))
-                    local_file.unlink()
-
-                local_file.parent.mkdir(parents=True, exist_ok=True)
-                shutil.move(tmp_file, local_file)
-            else:
-                # Direct download
-                self.connection.download_file(remote_file, local_file, replace=replace)
+                # replace existing file only after new file is downloaded
+                # to avoid issues then there is no free space to download new file, but existing one is already gone.
+                # parent directory is already created by _create_dirs
+                self._move_local_file(tmp_file, local_file)
 
             if self.hwm_type:
-                strategy = StrategyManager.get_current()
-                strategy.hwm.update(remote_file)
-                strategy.save_hwm()
+                self._update_hwm(remote_file, hwm_lock)
 
             # Delete Remote
             if self.options.delete_source:
@@ -824,6 +897,33 @@ class FileDownloader(FrozenModel):
                 exception=e,
             )
 
+    @staticmethod
+    def _move_local_file(source: LocalPath, target: LocalPath) -> None:
+        try:
+            # atomic rename, existing file is overwritten
+            os.replace(source, target)
+        except OSError as e:
+            if e.errno != errno.EXDEV:
+                raise
+
+            # temp_path and local_path are located on different filesystems
+            shutil.move(source, target)
+
+    def _update_hwm(self, remote_file: PathWithStatsProtocol, hwm_lock: threading.RLock) -> None:
+        strategy: HWMStrategy = StrategyManager.get_current()
+        with hwm_lock:
+            strategy.hwm.update(remote_file)
+            self._hwm_unsaved_files += 1
+
+            if self._hwm_unsaved_files >= self.options.hwm_save_interval:
+                self._save_hwm(hwm_lock)
+
+    def _save_hwm(self, hwm_lock: threading.RLock) -> None:
+        strategy: HWMStrategy = StrategyManager.get_current()
+        with hwm_lock:
+            strategy.save_hwm()
+            self._hwm_unsaved_files = 0
+
     def _remove_temp_dir(self, temp_dir: LocalPath) -> None:
         log.info("|Local FS| Removing temp directory '%s'", temp_dir)
 
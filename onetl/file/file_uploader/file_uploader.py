@@ -482,7 +482,8 @@ class FileUploader(FrozenModel):
                     # Wrong path (not relative path and source path not in the path to the file)
                     raise ValueError(f"File path '{local_file}' does not match source_path '{self.local_path}'")
 
-            if local_file.exists() and not local_file.is_file():
+            # is_file() is False for both missing files and directories, so the second stat is made only in rare cases
+            if not local_file.is_file() and local_file.exists():
                 raise NotAFileError(f"{path_repr(local_file)} is not a file")
 
             result.add((local_file, target_file, tmp_file))
@@ -544,7 +545,7 @@ class FileUploader(FrozenModel):
 
         if workers > 1:
             with ThreadPoolExecutor(
-                max_workers=max(workers, len(to_upload)),
+                max_workers=min(workers, len(to_upload)),
                 thread_name_prefix=self.__class__.__name__,
             ) as executor:
                 futures = [
@@ -587,8 +588,13 @@ class FileUploader(FrozenModel):
             return FileUploadStatus.MISSING, local_file
 
         try:
-            replace = False
-            if self.connection.path_exists(target_file):
+            # upload_file and rename_file already handle existing target file if replace=True,
+            # so do not send extra requests to the remote filesystem for every file
+            replace = self.options.if_exists in {
+                FileExistBehavior.REPLACE_FILE,
+                FileExistBehavior.REPLACE_ENTIRE_DIRECTORY,
+            }
+            if not replace and self.connection.path_exists(target_file):
                 file = self.connection.resolve_file(target_file)
                 if self.options.if_exists == FileExistBehavior.ERROR:
                     raise FileExistsError(f"File {path_repr(file)} already exists")
@@ -597,8 +603,6 @@ class FileUploader(FrozenModel):
                     log.warning("|%s| File %s already exists, skipping", self.__class__.__name__, path_repr(file))
                     return FileUploadStatus.SKIPPED, local_file
 
-                replace = True
-
             if tmp_file:
                 # Files are loaded to temporary directory before moving them to target dir.
                 # This prevents operations with partly uploaded files
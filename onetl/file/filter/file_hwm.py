@@ -14,7 +14,10 @@
 
 from __future__ import annotations
 
-from etl_entities import FileHWM
+from typing import Any, FrozenSet, Optional
+
+from etl_entities import FileHWM, FileListHWM
+from pydantic import PrivateAttr
 
 from onetl.base import BaseFileFilter, PathProtocol
 from onetl.impl import FrozenModel
@@ -40,10 +43,18 @@ class FileHWMFilter(BaseFileFilter, FrozenModel):
 
     hwm: FileHWM
 
+    # HWM value and all paths covered by it, to avoid building them for every matched file
+    _cached_value: Optional[Any] = PrivateAttr(default=None)
+    _cached_covered_paths: FrozenSet = PrivateAttr(default_factory=frozenset)
+
     def match(self, path: PathProtocol) -> bool:
         if path.is_dir():
             return True
 
+        if isinstance(self.hwm, FileListHWM):
+            # FileListHWM.covers builds a set of absolute paths on each call, which is O(N) per file
+            return path not in self._get_covered_paths()
+
         return not self.hwm.covers(path)
 
     def __str__(self):
@@ -51,3 +62,12 @@ class FileHWMFilter(BaseFileFilter, FrozenModel):
 
     def __repr__(self):
         return f"{self.hwm.__class__.__name__}(qualified_name={self.hwm.qualified_name!r})"
+
+    def _get_covered_paths(self) -> frozenset:
+        # HWM value is immutable, but could be replaced with a new one by update()
+        if self._cached_value is not self.hwm.value:
+            # both relative and absolute paths, same as FileListHWM.covers, but using just one lookup
+            self._cached_covered_paths = self.hwm.value | abs(self.hwm)
+            self._cached_value = self.hwm.value
+
+        return self._cached_covered_paths
@@ -212,6 +212,9 @@ def log_with_indent(
         DEBUG onetl.module            message with additional indent
 
     """
+    if not logger.isEnabledFor(level):
+        return
+
     _log(logger, "%s" + inp, " " * (BASE_LOG_INDENT + indent), *args, level=level, stacklevel=stacklevel + 1, **kwargs)
 
 
@@ -248,6 +251,9 @@ def log_lines(
 
     """
 
+    if not logger.isEnabledFor(level):
+        return
+
     base_indent = " " * (BASE_LOG_INDENT + indent)
     stacklevel += 1
     for index, line in enumerate(dedent(inp).splitlines()):
@@ -292,6 +298,9 @@ def log_json(
 
     """
 
+    if not logger.isEnabledFor(level):
+        return
+
     log_lines(logger, json.dumps(inp, indent=4), name, indent, level, stacklevel=stacklevel + 1)
 
 
@@ -348,6 +357,9 @@ def log_collection(
 
     """
 
+    if not logger.isEnabledFor(level):
+        return
+
     base_indent = " " * (BASE_LOG_INDENT + indent)
     stacklevel += 1
     items = list(collection)  # force convert all iterators to list to know size
@@ -399,6 +411,9 @@ def entity_boundary_log(logger: logging.Logger, msg: str, char: str = "=", stack
         ------------------- End ----------------------
 
     """
+    if not logger.isEnabledFor(logging.INFO):
+        return
+
     filing = char * (HALF_SCREEN_SIZE - len(msg) // 2)
     _log(logger, "%s %s %s", filing, msg, filing, stacklevel=stacklevel + 1)
 
@@ -440,6 +455,9 @@ def log_options(
 
     """
 
+    if not logger.isEnabledFor(kwargs.get("level", logging.INFO)):
+        return
+
     stacklevel += 1
     if options:
         log_with_indent(logger, "%s = {", name, indent=indent, stacklevel=stacklevel, **kwargs)
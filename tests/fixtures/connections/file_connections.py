@@ -1,9 +1,12 @@
+import os
 import secrets
 import shutil
 
 import pytest
 from pytest_lazyfixture import lazy_fixture
 
+from onetl.impl import LocalPath
+
 
 @pytest.fixture(
     params=[
@@ -61,3 +64,11 @@ def file_connection_test_files(file_connection_resource_path):
         resource_path / "ascii.txt",
         resource_path / "utf-8.txt",
     ]
+
+
+@pytest.fixture()
+def file_connection_resource_files(file_connection_resource_path):
+    result = []
+    for root, _dirs, files in os.walk(file_connection_resource_path):
+        result.extend(LocalPath(root) / file for file in files)
+    return result
@@ -4,7 +4,7 @@ import pytest
 from pytest_lazyfixture import lazy_fixture
 
 
-@pytest.fixture()
+@pytest.fixture(scope="session")
 def file_df_schema():
     from pyspark.sql.types import (
         DateType,
@@ -28,7 +28,7 @@ def file_df_schema():
     )
 
 
-@pytest.fixture()
+@pytest.fixture(scope="session")
 def file_df_schema_str_value_last():
     # partitioned dataframe has "str_value" column moved to the end
     from pyspark.sql.types import (
@@ -53,7 +53,7 @@ def file_df_schema_str_value_last():
     )
 
 
-@pytest.fixture()
+@pytest.fixture(scope="session")
 def file_df_dataframe(spark, file_df_schema):
     data = [
         [1, "val1", 123, datetime.date(2021, 1, 1), datetime.datetime(2021, 1, 1, 1, 1, 1), 1.23],
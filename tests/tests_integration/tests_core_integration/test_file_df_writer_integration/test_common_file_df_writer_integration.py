@@ -54,7 +54,7 @@ def test_file_df_writer_run_target_does_not_exist(
     )
     read_df = reader.run()
 
-    assert read_df.count()
+    assert read_df.take(1)
     assert read_df.schema == df.schema
     assert_equal_df(df, read_df)
 
@@ -107,7 +107,7 @@ def test_file_df_writer_run_if_exists_skip_entire_directory(
 
     read_df = reader.run()
 
-    assert read_df.count()
+    assert read_df.take(1)
     assert read_df.schema == df.schema
     assert_equal_df(read_df, df1, order_by="id")
 
@@ -140,7 +140,7 @@ def test_file_df_writer_run_if_exists_replace_overlapping_partitions_target_not_
 
     read_df = reader.run()
 
-    assert read_df.count()
+    assert read_df.take(1)
     assert read_df.schema == file_df_schema_str_value_last
     assert_equal_df(read_df, df1, order_by="id")
 
@@ -172,7 +172,7 @@ def test_file_df_writer_run_if_exists_replace_overlapping_partitions_target_part
 
     read_df = reader.run()
 
-    assert read_df.count()
+    assert read_df.take(1)
     assert read_df.schema == df.schema
     assert_equal_df(read_df, df1, order_by="id")
 
@@ -248,7 +248,7 @@ def test_file_df_writer_run_if_exists_replace_overlapping_partitions_to_overlapp
     )
 
     read_df = reader.run()
-    assert read_df.count()
+    assert read_df.take(1)
     assert read_df.schema == file_df_schema_str_value_last
 
     # rows from df1 with str_value == "val2" are overwritten by rows from df2, but others left intact
@@ -327,7 +327,7 @@ def test_file_df_writer_run_if_exists_replace_entire_directory(
     )
     read_df = reader.run()
 
-    assert read_df.count()
+    assert read_df.take(1)
     assert read_df.schema == real_df_schema
     # directory content is replaced with new data
     assert_equal_df(read_df, df2, order_by="id")
@@ -369,7 +369,7 @@ def test_file_df_writer_run_if_exists_append_target_not_partitioned_df_is(
 
     read_df = reader.run()
 
-    assert read_df.count()
+    assert read_df.take(1)
     assert read_df.schema == file_df_schema_str_value_last
     # data from df1 is still there, but Spark ignores it because it is not in any partition subpath
     assert_equal_df(read_df, df2, order_by="id")
@@ -414,7 +414,7 @@ def test_file_df_writer_run_if_exists_append_target_partitioned_df_is_not(
 
     read_df = reader.run()
 
-    assert read_df.count()
+    assert read_df.take(1)
     assert read_df.schema == file_df_schema_str_value_last
     # data from df2 is there, but Spark ignores it because it is not in any partition subpath
     assert_equal_df(read_df, df1, order_by="id")
@@ -494,7 +494,7 @@ def test_file_df_writer_run_if_exists_append_to_overlapping_partitions(
 
     read_df = reader.run()
 
-    assert read_df.count()
+    assert read_df.take(1)
     assert read_df.schema == file_df_schema_str_value_last
     # existing partitions are appended, not replaced
     assert_equal_df(read_df, df, order_by="id")
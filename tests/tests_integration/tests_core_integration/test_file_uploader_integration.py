@@ -1,5 +1,4 @@
 import logging
-import os
 import re
 import secrets
 import tempfile
@@ -12,7 +11,7 @@ from onetl.file import FileUploader
 from onetl.impl import FailedLocalFile, FileExistBehavior, LocalPath, RemoteFile
 
 
-def test_file_uploader_view_files(file_connection, file_connection_resource_path):
+def test_file_uploader_view_files(file_connection, file_connection_resource_path, file_connection_resource_files):
     target_path = f"/tmp/test_upload_{secrets.token_hex(5)}"
     resource_path = file_connection_resource_path
 
@@ -25,14 +24,8 @@ def test_file_uploader_view_files(file_connection, file_connection_resource_path
 
     local_files = uploader.view_files()
 
-    local_files_list = []
-
-    for root, _dirs, files in os.walk(resource_path):
-        for file in files:
-            local_files_list.append(LocalPath(root) / file)
-
     assert local_files
-    assert sorted(local_files) == sorted(local_files_list)
+    assert sorted(local_files) == sorted(file_connection_resource_files)
 
 
 @pytest.mark.parametrize("path_type", [str, PurePosixPath], ids=["path_type str", "path_type PurePosixPath"])
@@ -74,8 +67,11 @@ def test_file_uploader_run_with_files(
     assert not upload_result.skipped
     assert upload_result.successful
 
-    assert sorted(upload_result.successful) == sorted(PurePosixPath(target_path) / file.name for file in test_files)
+    # target_path could be a str
+    remote_target_path = PurePosixPath(target_path)
+    assert upload_result.successful == {remote_target_path / file.name for file in test_files}
 
+    local_files_by_name = {file.name: file for file in test_files}
     for remote_file in upload_result.successful:
         assert isinstance(remote_file, RemoteFile)
 
@@ -84,20 +80,28 @@ def test_file_uploader_run_with_files(
         assert not remote_file.is_dir()
 
         # directory structure is being flattened during upload, restoring it
-        local_file = next(file for file in test_files if file.name == remote_file.name)
+        local_file = local_files_by_name[remote_file.name]
 
         # file size is same as expected
-        assert file_connection.get_stat(remote_file).st_size == local_file.stat().st_size
-        assert file_connection.get_stat(remote_file).st_size == remote_file.stat().st_size
+        remote_file_size = file_connection.get_stat(remote_file).st_size
+        assert remote_file_size == local_file.stat().st_size
+        assert remote_file_size == remote_file.stat().st_size
 
         # file content is same as expected
         assert file_connection.read_bytes(remote_file) == local_file.read_bytes()
 
 
 @pytest.mark.parametrize("path_type", [str, PurePosixPath], ids=["path_type str", "path_type Path"])
-def test_file_uploader_run_with_local_path(request, file_connection, file_connection_resource_path, path_type):
+def test_file_uploader_run_with_local_path(
+    request,
+    file_connection,
+    file_connection_resource_path,
+    file_connection_resource_files,
+    path_type,
+):
     target_path = PurePosixPath(f"/tmp/test_upload_{secrets.token_hex(5)}")
     resource_path = file_connection_resource_path
+    local_files_list = file_connection_resource_files
 
     def finalizer():
         file_connection.remove_dir(target_path, recursive=True)
@@ -118,27 +122,21 @@ def test_file_uploader_run_with_local_path(request, file_connection, file_connec
     assert not upload_result.skipped
     assert upload_result.successful
 
-    local_files_list = []
-
-    for root, _, files in os.walk(resource_path):
-        for file_name in files:
-            local_files_list.append(Path(root) / file_name)
-
-    assert sorted(path for path in upload_result.successful) == sorted(
-        Path(target_path) / file.relative_to(resource_path) for file in local_files_list
-    )
+    assert upload_result.successful == {target_path / file.relative_to(resource_path) for file in local_files_list}
 
+    local_files_by_name = {file.name: file for file in local_files_list}
     for remote_file in upload_result.successful:
         assert remote_file.exists()
         assert remote_file.is_file()
         assert not remote_file.is_dir()
 
         # directory structure is being flattened during upload, restoring it
-        local_file = next(file for file in local_files_list if file.name == remote_file.name)
+        local_file = local_files_by_name[remote_file.name]
 
         # file size is same as expected
-        assert file_connection.get_stat(remote_file).st_size == local_file.stat().st_size
-        assert file_connection.get_stat(remote_file).st_size == remote_file.stat().st_size
+        remote_file_size = file_connection.get_stat(remote_file).st_size
+        assert remote_file_size == local_file.stat().st_size
+        assert remote_file_size == remote_file.stat().st_size
 
         # file content is same as expected
         assert file_connection.read_bytes(remote_file) == local_file.read_bytes()
@@ -184,12 +182,11 @@ def test_file_uploader_run_missing_file(request, file_connection, file_connectio
 def test_file_uploader_run_delete_local(
     request,
     file_connection,
-    file_connection_resource_path,
+    file_connection_resource_files,
     file_connection_test_files,
     caplog,
 ):
     target_path = PurePosixPath(f"/tmp/test_upload_{secrets.token_hex(5)}")
-    resource_path = file_connection_resource_path
     test_files = file_connection_test_files
 
     def finalizer():
@@ -203,16 +200,12 @@ def test_file_uploader_run_delete_local(
         options=FileUploader.Options(delete_local=True),
     )
 
-    local_files_list = []
     local_files_stat = {}
     local_files_bytes = {}
 
-    for root, _, files in os.walk(resource_path):
-        for file_name in files:
-            local_file = Path(root) / file_name
-            local_files_list.append(local_file)
-            local_files_stat[local_file] = local_file.stat()
-            local_files_bytes[local_file] = local_file.read_bytes()
+    for local_file in file_connection_resource_files:
+        local_files_stat[local_file] = local_file.stat()
+        local_files_bytes[local_file] = local_file.read_bytes()
 
     with caplog.at_level(logging.WARNING):
         upload_result = uploader.run(test_files)
@@ -224,13 +217,12 @@ def test_file_uploader_run_delete_local(
     assert not upload_result.missing
     assert upload_result.successful
 
-    assert sorted(upload_result.successful) == sorted(target_path / file.name for file in test_files)
+    assert upload_result.successful == {target_path / file.name for file in test_files}
 
-    existing_files = []
-    for root, _dirs, files in os.walk(resource_path):
-        for file_name in files:
-            existing_files.append(Path(root) / file_name)
+    # resource files were listed before upload, no need to walk through the directory tree again
+    existing_files = {file for file in file_connection_resource_files if file.exists()}
 
+    local_files_by_name = {file.name: file for file in test_files}
     for remote_file in upload_result.successful:
         assert isinstance(remote_file, RemoteFile)
 
@@ -239,11 +231,12 @@ def test_file_uploader_run_delete_local(
         assert not remote_file.is_dir()
 
         # directory structure is being flattened during upload, restoring it
-        local_file = next(file for file in test_files if file.name == remote_file.name)
+        local_file = local_files_by_name[remote_file.name]
 
         # file size is same as expected
-        assert file_connection.get_stat(remote_file).st_size == local_files_stat[local_file].st_size
-        assert file_connection.get_stat(remote_file).st_size == remote_file.stat().st_size
+        remote_file_size = file_connection.get_stat(remote_file).st_size
+        assert remote_file_size == local_files_stat[local_file].st_size
+        assert remote_file_size == remote_file.stat().st_size
 
         # file content is same as expected
         assert file_connection.read_bytes(remote_file) == local_files_bytes[local_file]
@@ -285,7 +278,7 @@ def test_file_uploader_run_mode_fail(request, file_connection, file_connection_t
     assert not upload_result.skipped
     assert upload_result.failed
 
-    assert sorted(upload_result.failed) == sorted(test_files)
+    assert upload_result.failed == set(test_files)
 
     for local_file in upload_result.failed:
         assert isinstance(local_file, FailedLocalFile)
@@ -300,8 +293,9 @@ def test_file_uploader_run_mode_fail(request, file_connection, file_connection_t
         assert re.search(rf"File '{remote_file}' \(kind='file', .*\) already exists", str(local_file.exception))
 
         # file size wasn't changed
-        assert file_connection.get_stat(remote_file).st_size != local_file.stat().st_size
-        assert file_connection.get_stat(remote_file).st_size == remote_file.stat().st_size
+        remote_file_size = file_connection.get_stat(remote_file).st_size
+        assert remote_file_size != local_file.stat().st_size
+        assert remote_file_size == remote_file.stat().st_size
 
         # file content wasn't changed
         assert file_connection.read_text(remote_file) == "unchanged"
@@ -340,7 +334,7 @@ def test_file_uploader_run_mode_skip_file(request, file_connection, file_connect
     assert not upload_result.failed
     assert upload_result.skipped
 
-    assert sorted(upload_result.skipped) == sorted(test_files)
+    assert upload_result.skipped == set(test_files)
 
     for local_file in upload_result.skipped:
         assert isinstance(local_file, LocalPath)
@@ -352,8 +346,9 @@ def test_file_uploader_run_mode_skip_file(request, file_connection, file_connect
         remote_file = remote_files[remote_files.index(target_path / local_file.name)]
 
         # file size wasn't changed
-        assert file_connection.get_stat(remote_file).st_size != local_file.stat().st_size
-        assert file_connection.get_stat(remote_file).st_size == remote_file.stat().st_size
+        remote_file_size = file_connection.get_stat(remote_file).st_size
+        assert remote_file_size != local_file.stat().st_size
+        assert remote_file_size == remote_file.stat().st_size
 
         # file content wasn't changed
         assert file_connection.read_text(remote_file) == "unchanged"
@@ -392,8 +387,9 @@ def test_file_uploader_run_mode_replace_file(request, file_connection, file_conn
     assert not upload_result.missing
     assert upload_result.successful
 
-    assert sorted(upload_result.successful) == sorted(PurePosixPath(file) for file in remote_files)
+    assert upload_result.successful == {PurePosixPath(file) for file in remote_files}
 
+    local_files_by_name = {file.name: file for file in test_files}
     for remote_file in upload_result.successful:
         assert remote_file.exists()
         assert remote_file.is_file()
@@ -402,12 +398,13 @@ def test_file_uploader_run_mode_replace_file(request, file_connection, file_conn
         old_remote_file = remote_files[remote_files.index(target_path / remote_file.name)]
 
         # directory structure is being flattened during upload, restoring it
-        local_file = next(file for file in test_files if file.name == remote_file.name)
+        local_file = local_files_by_name[remote_file.name]
 
         # file size was changed
-        assert file_connection.get_stat(remote_file).st_size != old_remote_file.stat().st_size
-        assert file_connection.get_stat(remote_file).st_size == local_file.stat().st_size
-        assert file_connection.get_stat(remote_file).st_size == remote_file.stat().st_size
+        remote_file_size = file_connection.get_stat(remote_file).st_size
+        assert remote_file_size != old_remote_file.stat().st_size
+        assert remote_file_size == local_file.stat().st_size
+        assert remote_file_size == remote_file.stat().st_size
 
         # file content was changed
         assert file_connection.read_text(remote_file) != "unchanged"
@@ -571,6 +568,7 @@ def test_file_uploader_run_with_relative_files_and_local_path(
     request,
     file_connection,
     file_connection_resource_path,
+    file_connection_resource_files,
     caplog,
 ):
     target_path = PurePosixPath(f"/tmp/test_upload_{secrets.token_hex(5)}")
@@ -588,11 +586,7 @@ def test_file_uploader_run_with_relative_files_and_local_path(
         local_path=resource_path,
     )
 
-    local_files_list = []
-    for root, _, files in os.walk(resource_path):
-        for file_name in files:
-            abs_path_file = Path(root) / file_name
-            local_files_list.append(abs_path_file.relative_to(resource_path))
+    local_files_list = [file.relative_to(resource_path) for file in file_connection_resource_files]
 
     with caplog.at_level(logging.WARNING):
         upload_result = uploader.run(local_files_list)
@@ -601,9 +595,7 @@ def test_file_uploader_run_with_relative_files_and_local_path(
     assert not upload_result.failed
     assert not upload_result.missing
     assert upload_result.successful
-    assert sorted(path for path in upload_result.successful) == sorted(
-        PurePosixPath(target_path) / file for file in local_files_list
-    )
+    assert upload_result.successful == {target_path / file for file in local_files_list}
 
     for remote_file in upload_result.successful:
         assert remote_file.exists()
@@ -613,8 +605,9 @@ def test_file_uploader_run_with_relative_files_and_local_path(
         local_file = resource_path / remote_file.relative_to(target_path)
 
         # file size is same as expected
-        assert file_connection.get_stat(remote_file).st_size == local_file.stat().st_size
-        assert file_connection.get_stat(remote_file).st_size == remote_file.stat().st_size
+        remote_file_size = file_connection.get_stat(remote_file).st_size
+        assert remote_file_size == local_file.stat().st_size
+        assert remote_file_size == remote_file.stat().st_size
 
         # file content is same as expected
         assert file_connection.read_bytes(remote_file) == local_file.read_bytes()
@@ -624,6 +617,7 @@ def test_file_uploader_run_with_absolute_files_and_local_path(
     request,
     file_connection,
     file_connection_resource_path,
+    file_connection_resource_files,
     caplog,
 ):
     target_path = PurePosixPath(f"/tmp/test_upload_{secrets.token_hex(5)}")
@@ -640,11 +634,7 @@ def test_file_uploader_run_with_absolute_files_and_local_path(
         target_path=target_path,
         local_path=resource_path,
     )
-    local_files_list = []
-
-    for root, _, files in os.walk(resource_path):
-        for file_name in files:
-            local_files_list.append(Path(root) / file_name)
+    local_files_list = file_connection_resource_files
 
     with caplog.at_level(logging.WARNING):
         upload_result = uploader.run(local_files_list)
@@ -653,9 +643,7 @@ def test_file_uploader_run_with_absolute_files_and_local_path(
     assert not upload_result.failed
     assert not upload_result.missing
     assert upload_result.successful
-    assert sorted(path for path in upload_result.successful) == sorted(
-        PurePosixPath(target_path) / file.relative_to(resource_path) for file in local_files_list
-    )
+    assert upload_result.successful == {target_path / file.relative_to(resource_path) for file in local_files_list}
 
     for remote_file in upload_result.successful:
         assert remote_file.exists()
@@ -665,8 +653,9 @@ def test_file_uploader_run_with_absolute_files_and_local_path(
         local_file = resource_path / remote_file.relative_to(target_path)
 
         # file size is same as expected
-        assert file_connection.get_stat(remote_file).st_size == local_file.stat().st_size
-        assert file_connection.get_stat(remote_file).st_size == remote_file.stat().st_size
+        remote_file_size = file_connection.get_stat(remote_file).st_size
+        assert remote_file_size == local_file.stat().st_size
+        assert remote_file_size == remote_file.stat().st_size
 
         # file content is same as expected
         assert file_connection.read_bytes(remote_file) == local_file.read_bytes()
@@ -718,7 +707,7 @@ def test_file_uploader_run_with_temp_path(file_connection, file_connection_test_
     assert not upload_result.skipped
     assert upload_result.successful
 
-    assert sorted(upload_result.successful) == sorted(target_path / file.name for file in test_files)
+    assert upload_result.successful == {target_path / file.name for file in test_files}
 
     if temp_path and file_connection.path_exists(temp_path):
         # temp_path is not removed after upload is finished,
@@ -5,6 +5,9 @@ import pytest
 
 from onetl.connection import Hive
 from onetl.db import DBReader
+from onetl.db.db_reader.strategy_helper import HWMStrategyHelper
+from onetl.hwm.store import MemoryHWMStore
+from onetl.strategy import IncrementalStrategy, SnapshotStrategy
 
 
 def test_reader_deprecated_import():
@@ -38,6 +41,52 @@ def test_reader_source_alias(spark_mock):
     assert reader1.source == reader2.source
 
 
+def test_reader_hashable(spark_mock):
+    hive = Hive(cluster="rnd-dwh", spark=spark_mock)
+    reader1 = DBReader(connection=hive, source="schema.table", columns=["a", "b"], where="a > 1")
+    reader2 = DBReader(connection=hive, source="schema.table", columns=["a", "b"], where="a > 1")
+    reader3 = DBReader(connection=hive, source="schema.table", columns=["a"], where="a > 1")
+
+    assert reader1 == reader2
+    assert hash(reader1) == hash(reader2)
+    assert reader1 != reader3
+
+    assert len({reader1, reader2, reader3}) == 2
+
+
+@pytest.mark.parametrize(
+    "hwm_column",
+    [
+        "c",
+        ("hwm", "cast(c as date)"),
+    ],
+)
+def test_reader_with_hwm_column_hashable(spark_mock, hwm_column):
+    hive = Hive(cluster="rnd-dwh", spark=spark_mock)
+    reader1 = DBReader(connection=hive, source="schema.table", hwm_column=hwm_column)
+    reader2 = DBReader(connection=hive, source="schema.table", hwm_column=hwm_column)
+    reader3 = DBReader(connection=hive, source="schema.table", hwm_column="d")
+
+    assert reader1 == reader2
+    assert hash(reader1) == hash(reader2)
+    assert reader1 != reader3
+
+    assert len({reader1, reader2, reader3}) == 2
+
+
+def test_reader_copy_hashable(spark_mock):
+    hive = Hive(cluster="rnd-dwh", spark=spark_mock)
+    reader = DBReader(connection=hive, source="schema.table", columns=["a", "b"])
+    hash(reader)
+
+    reader_copy = reader.copy(update={"source": "schema.another_table"})
+    new_reader = DBReader(connection=hive, source="schema.another_table", columns=["a", "b"])
+
+    # hash calculated for original reader should not be reused by its copy
+    assert hash(reader_copy) == hash(new_reader)
+    assert hash(reader_copy) != hash(reader)
+
+
 def test_reader_hive_with_read_options(spark_mock):
     with pytest.raises(ValueError, match=r"Hive does not implement ReadOptions, but \{'some': 'option'\} is passed"):
         DBReader(
@@ -230,3 +279,90 @@ def test_reader_hwm_column_and_columns_are_in_conflict(spark_mock, columns, hwm_
             columns=columns,
             hwm_column=hwm_column,
         )
+
+
+def test_reader_run_fetches_table_columns_once(spark_mock, mocker):
+    from pyspark.sql.types import IntegerType, StructField, StructType
+
+    schema = StructType([StructField("id", IntegerType()), StructField("value", IntegerType())])
+    get_df_schema = mocker.patch.object(Hive, "get_df_schema", return_value=schema)
+    read_source_as_df = mocker.patch.object(Hive, "read_source_as_df")
+    mocker.patch.object(Hive, "check")
+    mocker.patch.object(HWMStrategyHelper, "save", side_effect=lambda df: df)
+
+    reader = DBReader(
+        connection=Hive(cluster="rnd-dwh", spark=spark_mock),
+        table="schema.table",
+        hwm_column="id",
+    )
+
+    with MemoryHWMStore():
+        with IncrementalStrategy():
+            reader.run()
+
+    # table schema is fetched only once, and then reused to detect HWM column type
+    get_df_schema.assert_called_once()
+    assert read_source_as_df.call_args.kwargs["columns"] == ["id", "value"]
+
+
+def test_reader_run_cache_not_shared_between_strategies(spark_mock, mocker):
+    from pyspark.sql.types import IntegerType, StructField, StructType
+
+    old_schema = StructType([StructField("id", IntegerType()), StructField("value", IntegerType())])
+    new_schema = StructType([*old_schema.fields, StructField("new", IntegerType())])
+    get_df_schema = mocker.patch.object(Hive, "get_df_schema", return_value=old_schema)
+    read_source_as_df = mocker.patch.object(Hive, "read_source_as_df")
+    mocker.patch.object(Hive, "check")
+    mocker.patch.object(HWMStrategyHelper, "save", side_effect=lambda df: df)
+
+    reader = DBReader(
+        connection=Hive(cluster="rnd-dwh", spark=spark_mock),
+        table="schema.table",
+        hwm_column="id",
+    )
+
+    def read_source_as_df_with_nested_strategy(**kwargs):
+        # reader is called within another strategy while run() is still in progress
+        with SnapshotStrategy():
+            assert reader.get_df_schema() == new_schema
+
+    with MemoryHWMStore():
+        with IncrementalStrategy():
+            reader.run()
+
+        assert get_df_schema.call_count == 1
+        assert read_source_as_df.call_args.kwargs["columns"] == ["id", "value"]
+
+        get_df_schema.return_value = new_schema
+        read_source_as_df.side_effect = read_source_as_df_with_nested_strategy
+        with IncrementalStrategy():
+            reader.run()
+
+    # schema is fetched again by the second run, and by nested strategy
+    assert get_df_schema.call_count == 4
+    assert read_source_as_df.call_args.kwargs["columns"] == ["id", "value", "new"]
+
+
+def test_reader_run_fetches_schema_of_hwm_expression(spark_mock, mocker):
+    from pyspark.sql.types import DateType, IntegerType, StructField, StructType
+
+    table_schema = StructType([StructField("id", IntegerType()), StructField("value", IntegerType())])
+    hwm_schema = StructType([*table_schema.fields, StructField("hwm", DateType())])
+    get_df_schema = mocker.patch.object(Hive, "get_df_schema", side_effect=[table_schema, hwm_schema])
+    mocker.patch.object(Hive, "read_source_as_df")
+    mocker.patch.object(Hive, "check")
+    mocker.patch.object(HWMStrategyHelper, "save", side_effect=lambda df: df)
+
+    reader = DBReader(
+        connection=Hive(cluster="rnd-dwh", spark=spark_mock),
+        table="schema.table",
+        hwm_column=("hwm", "CAST(value AS DATE)"),
+    )
+
+    with MemoryHWMStore():
+        with IncrementalStrategy() as strategy:
+            reader.run()
+
+    # type of HWM expression is unknown until database is asked
+    assert get_df_schema.call_count == 2
+    assert strategy.hwm.__class__.__name__ == "DateHWM"
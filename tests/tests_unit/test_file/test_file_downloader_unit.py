@@ -1,5 +1,9 @@
+import copy
+import errno
 import re
 import textwrap
+import threading
+import time
 from unittest.mock import Mock
 
 import pytest
@@ -10,7 +14,11 @@ from onetl.core import FileFilter, FileLimit
 from onetl.file import FileDownloader
 from onetl.file.filter import Glob
 from onetl.file.limit import MaxFilesCount
+from onetl.hooks import hook
+from onetl.hwm.store import MemoryHWMStore
+from onetl.impl import RemoteFile, RemotePath, RemotePathStat
 from onetl.impl.file_exist_behavior import FileExistBehavior
+from onetl.strategy import IncrementalStrategy
 
 
 def test_file_downloader_deprecated_import():
@@ -203,3 +211,234 @@ def test_file_downloader_options_mode_deprecated(options, value, message):
 def test_file_downloader_options_modes_wrong():
     with pytest.raises(ValueError, match="value is not a valid enumeration member"):
         FileDownloader.Options(mode="wrong_mode")
+
+
+def test_file_downloader_workers_number_limited(tmp_path):
+    thread_names = set()
+
+    def download_file(remote_file, local_file, replace):
+        thread_names.add(threading.current_thread().name)
+        time.sleep(0.01)
+
+    connection = Mock(spec=BaseFileConnection)
+    connection.download_file.side_effect = download_file
+    connection.resolve_file.side_effect = lambda path: RemoteFile(path=path, stats=RemotePathStat(st_size=10))
+
+    downloader = FileDownloader(
+        connection=connection,
+        local_path=tmp_path,
+        options=FileDownloader.Options(workers=2),
+    )
+
+    files = [f"/remote/file{i}.txt" for i in range(10)]
+    result = downloader.run(files)
+
+    assert len(result.successful) == 10
+    assert len(thread_names) == 2
+
+
+def test_file_downloader_deepcopy(tmp_path):
+    downloader = FileDownloader(
+        connection=Mock(spec=BaseFileConnection),
+        local_path=tmp_path,
+        source_path="/remote",
+        options=FileDownloader.Options(workers=2),
+    )
+
+    for downloader_copy in (downloader.copy(deep=True), copy.deepcopy(downloader)):
+        assert downloader_copy.local_path == downloader.local_path
+        assert downloader_copy.source_path == downloader.source_path
+        assert downloader_copy.options == downloader.options
+
+
+def test_file_downloader_resolves_each_file_once(tmp_path):
+    def resolve_file(path):
+        if "missing" in str(path):
+            raise FileNotFoundError(path)
+        return RemoteFile(path=path, stats=RemotePathStat(st_size=10))
+
+    connection = Mock(spec=BaseFileConnection)
+    connection.resolve_file.side_effect = resolve_file
+
+    downloader = FileDownloader(connection=connection, local_path=tmp_path)
+    result = downloader.run(["/remote/file1.txt", "/remote/file2.txt", "/remote/missing.txt"])
+
+    assert len(result.successful) == 2
+    assert result.missing == {RemotePath("/remote/missing.txt")}
+
+    assert connection.resolve_file.call_count == 4
+    connection.path_exists.assert_not_called()
+
+
+@pytest.mark.parametrize("use_temp_path", [False, True])
+@pytest.mark.parametrize("if_exists", [FileExistBehavior.REPLACE_FILE, FileExistBehavior.ERROR])
+def test_file_downloader_file_removed_after_listing_is_missing(tmp_path, use_temp_path, if_exists):
+    def download_file(remote_file, local_file, replace):
+        if "removed" in str(remote_file):
+            raise FileNotFoundError(remote_file)
+        local_file.write_text("content")
+        return local_file
+
+    connection = Mock(spec=BaseFileConnection)
+    connection.resolve_file.side_effect = lambda path: RemoteFile(path=path, stats=RemotePathStat(st_size=10))
+    connection.download_file.side_effect = download_file
+
+    downloader = FileDownloader(
+        connection=connection,
+        local_path=tmp_path / "local",
+        temp_path=tmp_path / "temp" if use_temp_path else None,
+        options=FileDownloader.Options(if_exists=if_exists),
+    )
+    result = downloader.run(["/remote/file1.txt", "/remote/removed.txt"])
+
+    assert not result.failed
+    assert result.missing == {RemotePath("/remote/removed.txt")}
+    assert len(result.successful) == 1
+
+
+def test_file_downloader_run_calls_view_files_hooks(tmp_path, request):
+    connection = Mock(spec=BaseFileConnection)
+    connection.walk.return_value = [
+        (RemotePath("/remote"), [], [RemoteFile(path="file1.txt", stats=RemotePathStat(st_size=10))]),
+    ]
+
+    calls = []
+
+    @FileDownloader.view_files.bind
+    @hook
+    def view_files_hook(self):
+        calls.append(self)
+
+    request.addfinalizer(view_files_hook.disable)
+
+    downloader = FileDownloader(connection=connection, source_path="/remote", local_path=tmp_path)
+    result = downloader.run()
+
+    assert result.successful == {tmp_path / "file1.txt"}
+    assert calls == [downloader]
+
+
+def test_file_downloader_fetches_hwm_once(tmp_path, mocker):
+    connection = Mock(spec=BaseFileConnection)
+    connection.instance_url = "sftp://some.domain.com:22"
+    connection.walk.return_value = [
+        (RemotePath("/remote"), [], [RemoteFile(path="file1.txt", stats=RemotePathStat(st_size=10))]),
+    ]
+
+    downloader = FileDownloader(
+        connection=connection,
+        source_path="/remote",
+        local_path=tmp_path,
+        hwm_type="file_list",
+    )
+
+    hwm_store_get = mocker.spy(MemoryHWMStore, "get")
+    with MemoryHWMStore():
+        with IncrementalStrategy():
+            result = downloader.run()
+
+    assert result.successful == {tmp_path / "file1.txt"}
+    hwm_store_get.assert_called_once()
+
+
+def test_file_downloader_saves_hwm_with_interval(tmp_path, mocker):
+    connection = Mock(spec=BaseFileConnection)
+    connection.instance_url = "sftp://some.domain.com:22"
+    connection.walk.return_value = [
+        (
+            RemotePath("/remote"),
+            [],
+            [RemoteFile(path=f"file{i}.txt", stats=RemotePathStat(st_size=10)) for i in range(5)],
+        ),
+    ]
+
+    downloader = FileDownloader(
+        connection=connection,
+        source_path="/remote",
+        local_path=tmp_path,
+        hwm_type="file_list",
+        options=FileDownloader.Options(hwm_save_interval=2),
+    )
+
+    hwm_store_save = mocker.spy(MemoryHWMStore, "save")
+    with MemoryHWMStore() as hwm_store:
+        with IncrementalStrategy():
+            result = downloader.run()
+
+        # saved after 2nd, 4th and the last file, and then by strategy itself
+        assert len(result.successful) == 5
+        assert hwm_store_save.call_count == 4
+
+        hwm = hwm_store.get(hwm_store_save.call_args.args[1].qualified_name)
+        assert len(hwm.value) == 5
+
+
+@pytest.mark.parametrize("cross_filesystem", [False, True])
+def test_file_downloader_replace_file_via_temp_path(tmp_path, mocker, cross_filesystem):
+    def download_file(remote_file, local_file, replace):
+        local_file.write_text("new")
+
+    connection = Mock(spec=BaseFileConnection)
+    connection.download_file.side_effect = download_file
+    connection.resolve_file.side_effect = lambda path: RemoteFile(path=path, stats=RemotePathStat(st_size=10))
+
+    if cross_filesystem:
+        mocker.patch("os.replace", side_effect=OSError(errno.EXDEV, "Invalid cross-device link"))
+
+    local_path = tmp_path / "local"
+    local_path.mkdir()
+    local_file = local_path / "file.txt"
+    local_file.write_text("old")
+
+    downloader = FileDownloader(
+        connection=connection,
+        local_path=local_path,
+        temp_path=tmp_path / "temp",
+        options=FileDownloader.Options(if_exists="replace_file"),
+    )
+    result = downloader.run(["/remote/file.txt"])
+
+    assert result.successful == {local_file}
+    assert local_file.read_text() == "new"
+
+
+def test_file_downloader_preserves_source_path_structure(tmp_path):
+    connection = Mock(spec=BaseFileConnection)
+    connection.resolve_file.side_effect = lambda path: RemoteFile(path=path, stats=RemotePathStat(st_size=10))
+
+    downloader = FileDownloader(connection=connection, source_path="/remote", local_path=tmp_path)
+    result = downloader.run(["/remote/some/file1.txt", "another/file2.txt"])
+
+    assert result.successful == {tmp_path / "some" / "file1.txt", tmp_path / "another" / "file2.txt"}
+
+    with pytest.raises(ValueError, match="File path '/remote' does not match source_path '/remote'"):
+        downloader.run(["/remote"])
+
+    with pytest.raises(ValueError, match="File path '/remote2/file.txt' does not match source_path '/remote'"):
+        downloader.run(["/remote2/file.txt"])
+
+
+def test_file_downloader_resolves_files_in_workers(tmp_path):
+    thread_names = set()
+
+    def resolve_file(path):
+        thread_names.add(threading.current_thread().name)
+        time.sleep(0.01)
+        return RemoteFile(path=path, stats=RemotePathStat(st_size=10))
+
+    connection = Mock(spec=BaseFileConnection)
+    connection.resolve_file.side_effect = resolve_file
+
+    downloader = FileDownloader(
+        connection=connection,
+        local_path=tmp_path,
+        options=FileDownloader.Options(workers=2),
+    )
+
+    files = [f"/remote/file{i}.txt" for i in range(10)]
+    result = downloader.run(files)
+
+    assert len(result.successful) == 10
+    assert connection.resolve_file.call_count == 10
+    assert len(thread_names) == 2
+    assert threading.current_thread().name not in thread_names
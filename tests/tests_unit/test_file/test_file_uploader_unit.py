@@ -1,9 +1,14 @@
 import re
 import textwrap
+import threading
+import time
+from unittest.mock import Mock
 
 import pytest
 
+from onetl.base import BaseFileConnection
 from onetl.file import FileUploader
+from onetl.impl import RemoteFile, RemotePath, RemotePathStat
 from onetl.impl.file_exist_behavior import FileExistBehavior
 
 
@@ -76,3 +81,69 @@ def test_file_uploader_options_mode_deprecated(options, value, message):
 def test_file_uploader_options_modes_wrong():
     with pytest.raises(ValueError, match="value is not a valid enumeration member"):
         FileUploader.Options(mode="wrong_mode")
+
+
+@pytest.mark.parametrize("temp_path", [None, "/temp"])
+def test_file_uploader_replace_file_does_not_check_target(tmp_path, temp_path):
+    local_file = tmp_path / "file.txt"
+    local_file.write_text("new")
+
+    connection = Mock(spec=BaseFileConnection)
+    connection.create_dir.side_effect = RemotePath
+    connection.upload_file.side_effect = lambda local, remote, replace=False: RemoteFile(
+        path=remote,
+        stats=RemotePathStat(st_size=3),
+    )
+    connection.rename_file.side_effect = lambda source, target, replace=False: RemoteFile(
+        path=target,
+        stats=RemotePathStat(st_size=3),
+    )
+
+    uploader = FileUploader(
+        connection=connection,
+        target_path="/remote",
+        temp_path=temp_path,
+        options=FileUploader.Options(if_exists="replace_file"),
+    )
+    result = uploader.run([local_file])
+
+    assert result.successful == {RemotePath("/remote/file.txt")}
+
+    # existing file is handled by the connection itself
+    connection.path_exists.assert_not_called()
+    connection.resolve_file.assert_not_called()
+    if temp_path:
+        assert connection.rename_file.call_args.kwargs["replace"]
+    else:
+        assert connection.upload_file.call_args.kwargs["replace"]
+
+
+def test_file_uploader_limits_number_of_workers(tmp_path):
+    thread_names = set()
+
+    def upload_file(local, remote, replace=False):
+        thread_names.add(threading.current_thread().name)
+        time.sleep(0.01)
+        return RemoteFile(path=remote, stats=RemotePathStat(st_size=4))
+
+    connection = Mock(spec=BaseFileConnection)
+    connection.create_dir.side_effect = RemotePath
+    connection.path_exists.return_value = False
+    connection.upload_file.side_effect = upload_file
+
+    files = []
+    for i in range(10):
+        local_file = tmp_path / f"file{i}.txt"
+        local_file.write_text("data")
+        files.append(local_file)
+
+    uploader = FileUploader(
+        connection=connection,
+        target_path="/remote",
+        local_path=tmp_path,
+        options=FileUploader.Options(workers=2),
+    )
+    result = uploader.run(files)
+
+    assert len(result.successful) == 10
+    assert len(thread_names) == 2
@@ -0,0 +1,23 @@
+from etl_entities import FileListHWM, RemoteFolder
+
+from onetl.file.filter.file_hwm import FileHWMFilter
+from onetl.impl import RemoteDirectory, RemoteFile, RemotePathStat
+
+
+def test_file_hwm_filter_match():
+    hwm = FileListHWM(
+        source=RemoteFolder(name="/absolute", instance="ftp://ftp.server:21"),
+        value=["file1.csv", "nested/file2.csv"],
+    )
+    file_filter = FileHWMFilter(hwm=hwm)
+
+    assert not file_filter.match(RemoteFile(path="/absolute/file1.csv", stats=RemotePathStat(st_size=10)))
+    assert not file_filter.match(RemoteFile(path="/absolute/nested/file2.csv", stats=RemotePathStat(st_size=10)))
+    assert not file_filter.match(RemoteFile(path="file1.csv", stats=RemotePathStat(st_size=10)))
+    assert file_filter.match(RemoteFile(path="/absolute/file3.csv", stats=RemotePathStat(st_size=10)))
+    assert file_filter.match(RemoteFile(path="/another/file1.csv", stats=RemotePathStat(st_size=10)))
+    assert file_filter.match(RemoteDirectory("/absolute/file1.csv"))
+
+    # HWM value was changed after filter was created
+    hwm.update("/absolute/file3.csv")
+    assert not file_filter.match(RemoteFile(path="/absolute/file3.csv", stats=RemotePathStat(st_size=10)))
@@ -1,4 +1,5 @@
 import re
+from datetime import date, datetime
 
 import pytest
 
@@ -123,3 +124,18 @@ def test_clickhouse_without_mandatory_args(spark_mock):
             password="passwd",
             spark=spark_mock,
         )
+
+
+@pytest.mark.parametrize(
+    "value, expected",
+    [
+        (datetime(2023, 8, 15, 11, 22, 33, 123456), "CAST('2023-08-15 11:22:33' AS DateTime)"),
+        (datetime(2023, 8, 15), "CAST('2023-08-15 00:00:00' AS DateTime)"),
+        (datetime(5, 1, 2, 3, 4, 5), "CAST('0005-01-02 03:04:05' AS DateTime)"),
+        (date(2023, 8, 15), "CAST('2023-08-15' AS Date)"),
+        (date(5, 1, 2), "CAST('0005-01-02' AS Date)"),
+    ],
+)
+def test_clickhouse_dialect_datetime_value_sql(value, expected):
+    # years below 1000 are padded with zeros, unlike strftime on some platforms
+    assert Clickhouse.Dialect._serialize_datetime_value(value) == expected
@@ -219,3 +219,27 @@ def test_hive_write_options_mode_deprecated(options, value, message):
 def test_hive_write_options_mode_unsupported(options):
     with pytest.raises(ValueError, match="value is not a valid enumeration member"):
         Hive.WriteOptions(**options)
+
+
+def test_hive_write_df_to_existing_table_columns_order(spark_mock, mocker):
+    from pyspark.sql.types import IntegerType, StringType, StructField, StructType
+
+    hive = Hive(cluster="rnd-dwh", spark=spark_mock)
+    table_schema = StructType(
+        [
+            StructField("id", IntegerType()),
+            StructField("name", StringType()),
+            StructField("part", IntegerType()),
+        ],
+    )
+    get_df_schema = mocker.patch.object(Hive, "get_df_schema", return_value=table_schema)
+    save_as_table = mocker.patch.object(Hive, "_save_as_table")
+
+    df = mocker.Mock(columns=["Part", "ID", "name"])
+    hive.write_df_to_target(df, "schema.table")
+
+    # table columns are fetched only once, and then used to insert data by column position
+    get_df_schema.assert_called_once_with("schema.table")
+    df.select.assert_called_once_with("ID", "name", "Part")
+    df.select.return_value.write.insertInto.assert_called_once_with("schema.table", overwrite=False)
+    save_as_table.assert_not_called()
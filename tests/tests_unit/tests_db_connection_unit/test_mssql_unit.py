@@ -152,3 +152,10 @@ def test_mssql_without_mandatory_args(spark_mock):
             password="passwd",
             spark=spark_mock,
         )
+
+
+def test_mssql_read_options_partition_column_hash():
+    assert MSSQL.ReadOptions._get_partition_column_hash("some_column", 10) == (
+        "ABS(CAST(CHECKSUM(some_column) AS BIGINT)) % 10"
+    )
+    assert MSSQL.ReadOptions._get_partition_column_mod("some_column", 10) == "some_column % 10"
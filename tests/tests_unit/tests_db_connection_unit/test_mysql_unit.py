@@ -1,4 +1,5 @@
 import re
+from datetime import date, datetime
 
 import pytest
 
@@ -43,7 +44,10 @@ def test_mysql(spark_mock):
     assert conn.password.get_secret_value() == "passwd"
     assert conn.database == "database"
 
-    assert conn.jdbc_url == "jdbc:mysql://some_host:3306/database?characterEncoding=UTF-8&useUnicode=yes"
+    assert conn.jdbc_url == (
+        "jdbc:mysql://some_host:3306/database?cachePrepStmts=true&characterEncoding=UTF-8&"
+        "prepStmtCacheSize=250&rewriteBatchedStatements=true&useCursorFetch=true&useUnicode=yes"
+    )
 
     assert "password='passwd'" not in str(conn)
     assert "password='passwd'" not in repr(conn)
@@ -59,7 +63,10 @@ def test_mysql_with_port(spark_mock):
     assert conn.password.get_secret_value() == "passwd"
     assert conn.database == "database"
 
-    assert conn.jdbc_url == "jdbc:mysql://some_host:5000/database?characterEncoding=UTF-8&useUnicode=yes"
+    assert conn.jdbc_url == (
+        "jdbc:mysql://some_host:5000/database?cachePrepStmts=true&characterEncoding=UTF-8&"
+        "prepStmtCacheSize=250&rewriteBatchedStatements=true&useCursorFetch=true&useUnicode=yes"
+    )
 
 
 def test_mysql_without_database(spark_mock):
@@ -72,7 +79,10 @@ def test_mysql_without_database(spark_mock):
     assert conn.password.get_secret_value() == "passwd"
     assert not conn.database
 
-    assert conn.jdbc_url == "jdbc:mysql://some_host:3306?characterEncoding=UTF-8&useUnicode=yes"
+    assert conn.jdbc_url == (
+        "jdbc:mysql://some_host:3306?cachePrepStmts=true&characterEncoding=UTF-8&"
+        "prepStmtCacheSize=250&rewriteBatchedStatements=true&useCursorFetch=true&useUnicode=yes"
+    )
 
 
 def test_mysql_with_extra(spark_mock):
@@ -86,8 +96,9 @@ def test_mysql_with_extra(spark_mock):
     )
 
     assert conn.jdbc_url == (
-        "jdbc:mysql://some_host:3306/database?allowMultiQueries=true&characterEncoding=UTF-8&"
-        "requireSSL=true&useUnicode=yes"
+        "jdbc:mysql://some_host:3306/database?allowMultiQueries=true&cachePrepStmts=true&characterEncoding=UTF-8&"
+        "prepStmtCacheSize=250&requireSSL=true&rewriteBatchedStatements=true&"
+        "useCursorFetch=true&useUnicode=yes"
     )
 
     conn = MySQL(
@@ -99,7 +110,10 @@ def test_mysql_with_extra(spark_mock):
         spark=spark_mock,
     )
 
-    assert conn.jdbc_url == ("jdbc:mysql://some_host:3306/database?characterEncoding=CP-1251&useUnicode=no")
+    assert conn.jdbc_url == (
+        "jdbc:mysql://some_host:3306/database?cachePrepStmts=true&characterEncoding=CP-1251&"
+        "prepStmtCacheSize=250&rewriteBatchedStatements=true&useCursorFetch=true&useUnicode=no"
+    )
 
 
 def test_mysql_without_mandatory_args(spark_mock):
@@ -130,3 +144,28 @@ def test_mysql_without_mandatory_args(spark_mock):
             password="passwd",
             spark=spark_mock,
         )
+
+
+@pytest.mark.parametrize(
+    "value, expected",
+    [
+        (
+            datetime(2023, 8, 15, 11, 22, 33, 123456),
+            "STR_TO_DATE('2023-08-15 11:22:33.123456', '%Y-%m-%d %H:%i:%s.%f')",
+        ),
+        (datetime(2023, 8, 15), "STR_TO_DATE('2023-08-15 00:00:00.000000', '%Y-%m-%d %H:%i:%s.%f')"),
+        (datetime(5, 1, 2, 3, 4, 5, 6), "STR_TO_DATE('0005-01-02 03:04:05.000006', '%Y-%m-%d %H:%i:%s.%f')"),
+        (date(2023, 8, 15), "STR_TO_DATE('2023-08-15', '%Y-%m-%d')"),
+        (date(5, 1, 2), "STR_TO_DATE('0005-01-02', '%Y-%m-%d')"),
+    ],
+)
+def test_mysql_dialect_datetime_value_sql(value, expected):
+    # years below 1000 are padded with zeros, unlike strftime on some platforms
+    assert MySQL.Dialect._serialize_datetime_value(value) == expected
+
+
+def test_mysql_read_options_partition_column_hash():
+    assert MySQL.ReadOptions._get_partition_column_hash("some_column", 10) == (
+        "MOD(CRC32(CAST(some_column AS CHAR)), 10)"
+    )
+    assert MySQL.ReadOptions._get_partition_column_mod("some_column", 10) == "MOD(some_column, 10)"
@@ -1,4 +1,5 @@
 import re
+from datetime import date, datetime
 
 import pytest
 
@@ -162,3 +163,18 @@ def test_oracle_without_mandatory_args(spark_mock):
             password="passwd",
             spark=spark_mock,
         )
+
+
+@pytest.mark.parametrize(
+    "value, expected",
+    [
+        (datetime(2023, 8, 15, 11, 22, 33, 123456), "TO_DATE('2023-08-15 11:22:33', 'YYYY-MM-DD HH24:MI:SS')"),
+        (datetime(2023, 8, 15), "TO_DATE('2023-08-15 00:00:00', 'YYYY-MM-DD HH24:MI:SS')"),
+        (datetime(5, 1, 2, 3, 4, 5), "TO_DATE('0005-01-02 03:04:05', 'YYYY-MM-DD HH24:MI:SS')"),
+        (date(2023, 8, 15), "TO_DATE('2023-08-15', 'YYYY-MM-DD')"),
+        (date(5, 1, 2), "TO_DATE('0005-01-02', 'YYYY-MM-DD')"),
+    ],
+)
+def test_oracle_dialect_datetime_value_sql(value, expected):
+    # years below 1000 are padded with zeros, unlike strftime on some platforms
+    assert Oracle.Dialect._serialize_datetime_value(value) == expected
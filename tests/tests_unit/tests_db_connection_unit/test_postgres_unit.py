@@ -43,12 +43,78 @@ def test_postgres(spark_mock):
     assert conn.password.get_secret_value() == "passwd"
     assert conn.database == "database"
 
-    assert conn.jdbc_url == "jdbc:postgresql://some_host:5432/database?ApplicationName=abc"
+    assert conn.jdbc_url == "jdbc:postgresql://some_host:5432/database?ApplicationName=abc&reWriteBatchedInserts=true"
 
     assert "password='passwd'" not in str(conn)
     assert "password='passwd'" not in repr(conn)
 
 
+def test_postgres_jdbc_url_cached(spark_mock, mocker):
+    build_jdbc_url = mocker.spy(Postgres, "_build_jdbc_url")
+    conn = Postgres(host="some_host", user="user", database="database", password="passwd", spark=spark_mock)
+
+    assert conn.jdbc_url == "jdbc:postgresql://some_host:5432/database?ApplicationName=abc&reWriteBatchedInserts=true"
+    assert conn.jdbc_url == "jdbc:postgresql://some_host:5432/database?ApplicationName=abc&reWriteBatchedInserts=true"
+    build_jdbc_url.assert_called_once()
+
+
+def test_postgres_jdbc_url_copy(spark_mock):
+    conn = Postgres(host="some_host", user="user", database="database", password="passwd", spark=spark_mock)
+    assert conn.jdbc_url == "jdbc:postgresql://some_host:5432/database?ApplicationName=abc&reWriteBatchedInserts=true"
+
+    # cached URL of original connection is not used by copy
+    jdbc_url = conn.copy(update={"host": "another_host"}).jdbc_url
+    assert jdbc_url == "jdbc:postgresql://another_host:5432/database?ApplicationName=abc&reWriteBatchedInserts=true"
+    assert conn.jdbc_url == "jdbc:postgresql://some_host:5432/database?ApplicationName=abc&reWriteBatchedInserts=true"
+
+
+def test_postgres_jdbc_url_copy_with_extra(spark_mock):
+    conn = Postgres(host="some_host", user="user", database="database", password="passwd", spark=spark_mock)
+    assert conn.jdbc_url == "jdbc:postgresql://some_host:5432/database?ApplicationName=abc&reWriteBatchedInserts=true"
+
+    conn_copy = conn.copy(update={"extra": Postgres.Extra(ssl="true")})
+    assert conn_copy.jdbc_url == (
+        "jdbc:postgresql://some_host:5432/database?ApplicationName=abc&reWriteBatchedInserts=true&ssl=true"
+    )
+
+    # copy without changes can reuse cached URL
+    assert conn.copy().jdbc_url == conn.jdbc_url
+
+
+def test_postgres_jdbc_dialect_cached(spark_mock, mocker):
+    spark_mock._jvm = mocker.Mock()
+    get_dialect = spark_mock._jvm.org.apache.spark.sql.jdbc.JdbcDialects.get
+    get_dialect.side_effect = lambda url: f"dialect for {url}"
+
+    conn = Postgres(host="some_host", user="user", database="database", password="passwd", spark=spark_mock)
+    assert conn._get_jdbc_dialect() == f"dialect for {conn.jdbc_url}"
+    assert conn._get_jdbc_dialect() == f"dialect for {conn.jdbc_url}"
+    get_dialect.assert_called_once_with(conn.jdbc_url)
+
+    # dialect is resolved again for the copy with another JDBC URL
+    conn_copy = conn.copy(update={"host": "another_host"})
+    assert conn_copy._get_jdbc_dialect() == f"dialect for {conn_copy.jdbc_url}"
+    assert get_dialect.call_count == 2
+    assert conn._get_jdbc_dialect() == f"dialect for {conn.jdbc_url}"
+
+
+@pytest.mark.parametrize("value", ["false", "true"])
+def test_postgres_rewrite_batched_inserts_override(spark_mock, value):
+    conn = Postgres(
+        host="some_host",
+        user="user",
+        database="database",
+        password="passwd",
+        extra={"reWriteBatchedInserts": value},
+        spark=spark_mock,
+    )
+
+    assert conn.extra.reWriteBatchedInserts == value
+    assert conn.jdbc_url == (
+        f"jdbc:postgresql://some_host:5432/database?ApplicationName=abc&reWriteBatchedInserts={value}"
+    )
+
+
 def test_postgres_with_port(spark_mock):
     conn = Postgres(host="some_host", port=5000, user="user", database="database", password="passwd", spark=spark_mock)
 
@@ -59,7 +125,7 @@ def test_postgres_with_port(spark_mock):
     assert conn.password.get_secret_value() == "passwd"
     assert conn.database == "database"
 
-    assert conn.jdbc_url == "jdbc:postgresql://some_host:5000/database?ApplicationName=abc"
+    assert conn.jdbc_url == "jdbc:postgresql://some_host:5000/database?ApplicationName=abc&reWriteBatchedInserts=true"
 
 
 def test_postgres_without_database_error(spark_mock):
@@ -77,7 +143,10 @@ def test_postgres_with_extra(spark_mock):
         spark=spark_mock,
     )
 
-    assert conn.jdbc_url == "jdbc:postgresql://some_host:5432/database?ApplicationName=abc&autosave=always&ssl=true"
+    assert conn.jdbc_url == (
+        "jdbc:postgresql://some_host:5432/database?ApplicationName=abc&"
+        "autosave=always&reWriteBatchedInserts=true&ssl=true"
+    )
 
 
 def test_postgres_without_mandatory_args(spark_mock):
@@ -44,3 +44,133 @@ def test_ftp_connection_without_mandatory_args():
 
     with pytest.raises(ValueError):
         FTP()
+
+
+def test_ftp_connection_client_reused(mocker):
+    from onetl.connection import FTP
+
+    ftp = FTP(host="some_host")
+    client = mocker.Mock(closed=False)
+    get_client = mocker.patch.object(FTP, "_get_client", return_value=client)
+
+    assert ftp.client is client
+    assert ftp.client is client
+    get_client.assert_called_once()
+    client.keep_alive.assert_not_called()
+
+
+def test_ftp_connection_client_keep_alive(mocker):
+    from ftputil.error import FTPOSError
+
+    from onetl.connection import FTP
+
+    ftp = FTP(host="some_host")
+    old_client = mocker.Mock(closed=False)
+    new_client = mocker.Mock(closed=False)
+    mocker.patch("onetl.connection.file_connection.ftp.FTPHost", side_effect=[old_client, new_client])
+    monotonic = mocker.patch("time.monotonic", return_value=100)
+
+    assert ftp.client is old_client
+
+    # client was idle for too long, but connection is still alive
+    monotonic.return_value = 200
+    assert ftp.client is old_client
+    old_client.keep_alive.assert_called_once()
+
+    # connection was closed by server
+    monotonic.return_value = 300
+    old_client.keep_alive.side_effect = FTPOSError("timeout")
+    old_client.close.side_effect = OSError("connection reset")
+    assert ftp.client is new_client
+
+    # dead client is closed to release its sessions, errors are ignored
+    old_client.close.assert_called_once()
+    assert old_client not in ftp._clients_last_used
+
+
+def test_ftp_connection_client_recreated_after_close(mocker):
+    from onetl.connection import FTP
+
+    ftp = FTP(host="some_host")
+    old_client = mocker.Mock(closed=False)
+    new_client = mocker.Mock(closed=False)
+    mocker.patch.object(FTP, "_get_client", side_effect=[old_client, new_client])
+
+    assert ftp.client is old_client
+    old_client.closed = True
+    assert ftp.client is new_client
+
+
+def test_ftp_connection_read_bytes_retr(mocker):
+    from onetl.connection import FTP
+    from onetl.impl import RemotePath
+
+    ftp = FTP(host="some_host")
+    client = mocker.Mock(closed=False)
+    client._session.retrbinary.side_effect = lambda cmd, callback, blocksize: callback(b"content")
+    mocker.patch.object(FTP, "_get_client", return_value=client)
+
+    assert ftp._read_bytes(RemotePath("/some/file")) == b"content"
+    client._session.retrbinary.assert_called_once_with(
+        "RETR /some/file",
+        mocker.ANY,
+        blocksize=FTP._TRANSFER_BLOCK_SIZE,
+    )
+    client.open.assert_not_called()
+
+
+def test_ftp_connection_write_bytes_stor(mocker):
+    from onetl.connection import FTP
+    from onetl.impl import RemotePath
+
+    ftp = FTP(host="some_host")
+    client = mocker.Mock(closed=False)
+    client.path.abspath.side_effect = lambda path: path
+    mocker.patch.object(FTP, "_get_client", return_value=client)
+
+    ftp._write_bytes(RemotePath("/some/file"), b"content")
+
+    client._session.storbinary.assert_called_once_with(
+        "STOR /some/file",
+        mocker.ANY,
+        blocksize=FTP._TRANSFER_BLOCK_SIZE,
+    )
+    stream = client._session.storbinary.call_args.args[1]
+    assert stream.getvalue() == b"content"
+    client.stat_cache.invalidate.assert_called_once_with("/some/file")
+    client.open.assert_not_called()
+
+
+@pytest.mark.parametrize(
+    "method, args",
+    [
+        ("_read_bytes", ()),
+        ("_write_bytes", (b"content",)),
+    ],
+)
+@pytest.mark.parametrize(
+    "ftplib_error, expected_error",
+    [
+        ("error_perm", "PermanentError"),
+        ("error_temp", "TemporaryError"),
+    ],
+)
+def test_ftp_connection_transfer_errors_mapped_to_os_error(mocker, method, args, ftplib_error, expected_error):
+    import ftplib
+
+    from ftputil import error as ftp_error
+
+    from onetl.connection import FTP
+    from onetl.impl import RemotePath
+
+    ftp = FTP(host="some_host")
+    client = mocker.Mock(closed=False)
+    error = getattr(ftplib, ftplib_error)("550 Some error")
+    client._session.retrbinary.side_effect = error
+    client._session.storbinary.side_effect = error
+    mocker.patch.object(FTP, "_get_client", return_value=client)
+
+    with pytest.raises(getattr(ftp_error, expected_error)) as exc_info:
+        getattr(ftp, method)(RemotePath("/some/file"), *args)
+
+    assert isinstance(exc_info.value, OSError)
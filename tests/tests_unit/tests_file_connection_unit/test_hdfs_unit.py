@@ -261,3 +261,193 @@ def test_hdfs_known_get_current(request, mocker):
 
     hdfs = HDFS.get_current()
     assert hdfs.cluster == "rnd-dwh"
+
+
+def test_hdfs_walk_nested_directories_in_parallel(mocker):
+    from onetl.connection import HDFS
+
+    tree = {
+        "/root": ["dir1", "dir2", "file"],
+        "/root/dir1": ["nested", "file1"],
+        "/root/dir1/nested": ["file2"],
+        "/root/dir2": [],
+    }
+
+    def get_status(path):
+        return get_hdfs_status("DIRECTORY" if path in tree else "FILE")
+
+    def list_dir(path, status):
+        return [(name, get_status(f"{path}/{name}")) for name in tree[path]]
+
+    client = mocker.Mock()
+    client.status.side_effect = lambda path, strict=True: get_status(path)
+    client.list.side_effect = list_dir
+    mocker.patch.object(HDFS, "_get_client", return_value=client)
+    mocker.patch.object(HDFS, "_is_client_closed", return_value=False)
+
+    hdfs = HDFS(host="some-host.domain.com")
+    result = [(str(root), sorted(map(str, dirs)), sorted(map(str, files))) for root, dirs, files in hdfs.walk("/root")]
+
+    assert result == [
+        ("/root/dir1/nested", [], ["file2"]),
+        ("/root/dir1", ["nested"], ["file1"]),
+        ("/root/dir2", [], []),
+        ("/root", ["dir1", "dir2"], ["file"]),
+    ]
+    assert client.list.call_count == 4
+
+
+def test_hdfs_walk_limit_stops_scanning_directories(mocker):
+    from onetl.connection import HDFS
+    from onetl.file.limit import MaxFilesCount
+
+    dirs = [f"dir{i}" for i in range(1, 6)]
+    tree = {"/root": dirs, **{f"/root/{name}": ["file"] for name in dirs}}
+
+    def list_dir(path, status):
+        return [(name, get_hdfs_status("DIRECTORY" if f"{path}/{name}" in tree else "FILE")) for name in tree[path]]
+
+    client = mocker.Mock()
+    client.status.return_value = get_hdfs_status("DIRECTORY")
+    client.list.side_effect = list_dir
+    mocker.patch.object(HDFS, "_get_client", return_value=client)
+    mocker.patch.object(HDFS, "_is_client_closed", return_value=False)
+    mocker.patch.object(HDFS, "_WALK_MAX_WORKERS", 2)
+
+    hdfs = HDFS(host="some-host.domain.com")
+    result = [str(root) for root, _dirs, files in hdfs.walk("/root", limits=[MaxFilesCount(1)]) if files]
+
+    assert result == ["/root/dir1"]
+
+    # only a few directories are requested in advance, others are not scanned after limit is reached
+    listed = {call.args[0] for call in client.list.call_args_list}
+    assert listed >= {"/root", "/root/dir1"}
+    assert not listed & {"/root/dir4", "/root/dir5"}
+
+
+def test_hdfs_walk_with_kerberos_is_sequential(mocker):
+    from onetl.connection import HDFS
+
+    tree = {
+        "/root": ["dir1", "dir2"],
+        "/root/dir1": [],
+        "/root/dir2": [],
+    }
+
+    client = mocker.Mock()
+    client.status.return_value = get_hdfs_status("DIRECTORY")
+    client.list.side_effect = lambda path, status: [(name, get_hdfs_status("DIRECTORY")) for name in tree[path]]
+    mocker.patch.object(HDFS, "_get_client", return_value=client)
+    mocker.patch.object(HDFS, "_is_client_closed", return_value=False)
+    executor = mocker.patch("onetl.connection.file_connection.hdfs.ThreadPoolExecutor")
+
+    hdfs = HDFS(host="some-host.domain.com", user="user", password="password")
+    result = [str(root) for root, _dirs, _files in hdfs.walk("/root")]
+
+    assert result == ["/root/dir1", "/root/dir2", "/root"]
+    executor.assert_not_called()
+
+
+def get_hdfs_status(path_type: str, **kwargs) -> dict:
+    return {
+        "type": path_type,
+        "length": 0,
+        "modificationTime": 0,
+        "owner": "user",
+        "group": "group",
+        "permission": "755",
+        **kwargs,
+    }
+
+
+def test_hdfs_remove_file_single_status_request(mocker):
+    from onetl.connection import HDFS
+
+    client = mocker.Mock()
+    client.status.return_value = get_hdfs_status("FILE")
+    mocker.patch.object(HDFS, "_get_client", return_value=client)
+    mocker.patch.object(HDFS, "_is_client_closed", return_value=False)
+
+    hdfs = HDFS(host="some-host.domain.com")
+    assert hdfs.remove_file("/some/file")
+
+    client.status.assert_called_once_with("/some/file", strict=False)
+    client.delete.assert_called_once_with("/some/file", recursive=False)
+
+    client.status.return_value = None
+    assert not hdfs.remove_file("/some/file")
+
+
+def test_hdfs_remove_dir_recursive_single_delete_request(mocker):
+    from onetl.connection import HDFS
+
+    client = mocker.Mock()
+    client.status.return_value = get_hdfs_status("DIRECTORY", childrenNum=10)
+    mocker.patch.object(HDFS, "_get_client", return_value=client)
+    mocker.patch.object(HDFS, "_is_client_closed", return_value=False)
+
+    hdfs = HDFS(host="some-host.domain.com")
+    assert hdfs.remove_dir("/some/dir", recursive=True)
+
+    client.status.assert_called_once_with("/some/dir", strict=False)
+    client.list.assert_not_called()
+    client.delete.assert_called_once_with("/some/dir", recursive=True)
+
+
+def test_hdfs_remove_dir_not_empty(mocker):
+    from onetl.connection import HDFS
+    from onetl.exception import DirectoryNotEmptyError
+
+    client = mocker.Mock()
+    client.status.return_value = get_hdfs_status("DIRECTORY", childrenNum=10)
+    mocker.patch.object(HDFS, "_get_client", return_value=client)
+    mocker.patch.object(HDFS, "_is_client_closed", return_value=False)
+
+    hdfs = HDFS(host="some-host.domain.com")
+    with pytest.raises(DirectoryNotEmptyError, match="Cannot delete non-empty directory"):
+        hdfs.remove_dir("/some/dir")
+
+    client.delete.assert_not_called()
+
+
+def test_hdfs_kinit_called_only_once_per_interval(mocker):
+    from onetl.connection import HDFS
+
+    mocker.patch("onetl.connection.file_connection.hdfs._last_kinit", None)
+    kinit = mocker.patch("onetl.connection.file_connection.hdfs.kinit")
+    monotonic = mocker.patch("time.monotonic", return_value=100)
+
+    hdfs = HDFS(host="some-host.domain.com", user="some_user", password="pwd")
+    hdfs._kinit()
+    hdfs._kinit()
+    kinit.assert_called_once_with("some_user", keytab=None, password="pwd")
+
+    # ticket cache is shared by all connection instances
+    HDFS(host="another-host.domain.com", user="some_user", password="pwd")._kinit()
+    kinit.assert_called_once()
+
+    monotonic.return_value = 100 + HDFS._KINIT_INTERVAL
+    hdfs._kinit()
+    assert kinit.call_count == 2
+
+
+def test_hdfs_kinit_different_users(mocker):
+    from onetl.connection import HDFS
+
+    mocker.patch("onetl.connection.file_connection.hdfs._last_kinit", None)
+    kinit = mocker.patch("onetl.connection.file_connection.hdfs.kinit")
+    mocker.patch("time.monotonic", return_value=100)
+
+    hdfs1 = HDFS(host="some-host.domain.com", user="user1", password="pwd1")
+    hdfs2 = HDFS(host="some-host.domain.com", user="user2", password="pwd2")
+
+    hdfs1._kinit()
+    hdfs2._kinit()
+    # ticket of user1 was replaced by user2 in the same cache, so kinit should be called again
+    hdfs1._kinit()
+
+    assert kinit.call_args_list == [
+        mocker.call("user1", keytab=None, password="pwd1"),
+        mocker.call("user2", keytab=None, password="pwd2"),
+        mocker.call("user1", keytab=None, password="pwd1"),
+    ]
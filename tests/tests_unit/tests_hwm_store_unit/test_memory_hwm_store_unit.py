@@ -16,3 +16,13 @@ def test_hwm_store_memory_context_manager(caplog):
 
     assert HWMStoreManager.get_current() != hwm_store
     assert isinstance(HWMStoreManager.get_current(), YAMLHWMStore)
+
+
+def test_hwm_store_memory_copy_keeps_data(hwm_delta):
+    hwm, _ = hwm_delta
+    hwm_store = MemoryHWMStore()
+    hwm_store.save(hwm)
+
+    # MemoryHWMStore has no fields, but copy(update=...) should not reset stored values anyway
+    for store_copy in (hwm_store.copy(), hwm_store.copy(update={"some": "value"})):
+        assert store_copy.get(hwm.qualified_name) == hwm